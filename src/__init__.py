@@ -26,19 +26,24 @@ from .models import (
     IntentAnalysis, 
     LegitimacyAnalysis, 
     ThreatScore,
-    IntentType, 
+    IntentType,
     WhitelistCategory,
+    RiskLevel,
+    Severity,
+    Role,
     ConversationTurn,
     SessionMetadata,
     AttackChain,
     ConversationAnalysis,
     ErosionAnalysis,
     ConversationHistory,
+    ConversationHistoryColumnar,
     ConstraintViolation,
     ErosionPattern,
     SafetyBoundary,
     ReplayAnalysis,
     AttackTimeline,
+    TimelineEvent,
     ThreatActor
 )
 from .reporting import ReportGenerator
@@ -66,17 +71,22 @@ __all__ = [
     "ThreatScore",
     "IntentType",
     "WhitelistCategory",
+    "RiskLevel",
+    "Severity",
+    "Role",
     "ConversationTurn",
     "SessionMetadata",
     "AttackChain",
     "ConversationAnalysis",
     "ErosionAnalysis",
     "ConversationHistory",
+    "ConversationHistoryColumnar",
     "ConstraintViolation",
     "ErosionPattern",
     "SafetyBoundary",
     "ReplayAnalysis",
     "AttackTimeline",
+    "TimelineEvent",
     "ThreatActor",
     
     # Context types
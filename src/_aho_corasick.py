@@ -0,0 +1,80 @@
+"""
+Shared Aho-Corasick automaton for multi-pattern substring search.
+
+Finds every occurrence of every added word in a single left-to-right pass
+over the text, instead of one full scan per word. Used by the pattern
+extractor for keyword/phrase scanning and by the pattern library for
+matching its literal threat needles.
+
+The iteration API mirrors pyahocorasick: iter(text) yields
+(end_index, payload) pairs, where end_index is the index of the last
+matched character.
+"""
+
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+
+class AhoCorasick:
+    """Minimal Aho-Corasick automaton over unicode strings.
+
+    Build once with add_word + build, then reuse across scans.
+    """
+
+    __slots__ = ('_goto', '_fail', '_out', '_built')
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[Any, ...]] = [()]
+        self._built = False
+
+    def add_word(self, word: str, payload: Any) -> None:
+        """Register a word; payload is yielded for each match."""
+        state = 0
+        for char in word:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (payload,)
+
+    def build(self) -> None:
+        """Compute failure links (breadth-first) and merge outputs."""
+        queue = deque()
+        for state in self._goto[0].values():
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fall = self._goto[fail].get(char, 0)
+                if fall == nxt:
+                    fall = 0
+                self._fail[nxt] = fall
+                if self._out[fall]:
+                    self._out[nxt] = self._out[nxt] + self._out[fall]
+        self._built = True
+
+    def iter(self, text: str):
+        """Yield (end_index, payload) for every word occurrence in text."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        state = 0
+        for index, char in enumerate(text):
+            nxt = goto[state].get(char)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(char)
+            state = nxt if nxt is not None else 0
+            if out[state]:
+                for payload in out[state]:
+                    yield index, payload
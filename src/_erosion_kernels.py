@@ -0,0 +1,106 @@
+"""
+Tight-loop reducers for erosion metric computation.
+
+The kernels are written in plain index-based loop style over 1-D numeric
+buffers (array('d') / array('i')) so that Numba, when installed, can
+compile them to native code with @njit. Numba is strictly optional: the
+package carries no dependencies, and without it the same functions run
+as regular Python.
+"""
+
+try:
+    from numba import njit  # type: ignore
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def mean_velocity(scores):
+    """Average finite difference of an erosion score series.
+
+    Args:
+        scores: 1-D numeric buffer of per-turn erosion scores
+
+    Returns:
+        Mean per-step change, or 0.0 for series shorter than 2
+    """
+    n = len(scores)
+    if n < 2:
+        return 0.0
+    total = 0.0
+    for i in range(1, n):
+        total += scores[i] - scores[i - 1]
+    return total / (n - 1)
+
+
+@njit(cache=True)
+def score_moments(scores):
+    """Single-pass mean and sample variance via Welford accumulation.
+
+    Args:
+        scores: 1-D numeric buffer of per-turn erosion scores
+
+    Returns:
+        (mean, variance) tuple; variance is 0.0 for fewer than 2 scores
+    """
+    mean = 0.0
+    m2 = 0.0
+    n = 0
+    for score in scores:
+        n += 1
+        delta = score - mean
+        mean += delta / n
+        m2 += delta * (score - mean)
+    if n < 2:
+        return mean, 0.0
+    return mean, m2 / (n - 1)
+
+
+@njit(cache=True)
+def critical_turns(turns, scores, level, spike_ratio, spike_floor):
+    """Find turns where erosion hit a critical level or spiked suddenly.
+
+    A turn is critical when its score reaches `level`, or when it exceeds
+    the previous turn's score by `spike_ratio`x while also being above
+    `spike_floor`.
+
+    Args:
+        turns: 1-D numeric buffer of turn numbers
+        scores: parallel buffer of erosion scores
+        level: absolute score threshold
+        spike_ratio: multiple of the previous score that counts as a spike
+        spike_floor: minimum score for a spike to register
+
+    Returns:
+        List of critical turn numbers
+    """
+    result = []
+    for i in range(len(scores)):
+        score = scores[i]
+        if score >= level:
+            result.append(turns[i])
+        elif i >= 1 and score > scores[i - 1] * spike_ratio and score > spike_floor:
+            result.append(turns[i])
+    return result
+
+
+if _NUMBA_AVAILABLE:
+    # Warm the JIT cache once at import so first real use pays no
+    # compilation latency
+    from array import array as _array
+    _warm_scores = _array("d", [0.0, 10.0, 25.0, 60.0])
+    _warm_turns = _array("i", [1, 2, 3, 4])
+    mean_velocity(_warm_scores)
+    score_moments(_warm_scores)
+    critical_turns(_warm_turns, _warm_scores, 50.0, 2.0, 20.0)
+    del _warm_scores, _warm_turns
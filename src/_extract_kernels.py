@@ -0,0 +1,93 @@
+"""
+Tight-loop kernels for n-gram scanning in pattern extraction.
+
+The kernels operate on 1-D numeric buffers (array('q') / array('b')) in
+plain index-based loop style so that Numba, when installed, can compile
+them to native code with @njit. Numba is strictly optional: the package
+carries no dependencies, and without it the same functions run as
+regular Python.
+
+Hash values are only meaningful within a single process: the compiled
+kernels work in fixed-width int64 arithmetic while the pure-Python
+fallback uses exact ints, so all hashing for one extraction must go
+through the same functions.
+"""
+
+try:
+    from numba import njit  # type: ignore
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def ngram_hash_series(ids, n, base, mod, shift):
+    """Rolling polynomial hash of every n-word window in an id sequence.
+
+    Args:
+        ids: 1-D numeric buffer of interned word ids
+        n: window width in words
+        base: polynomial base
+        mod: hash modulus
+        shift: base ** (n - 1) reduced by mod
+
+    Returns:
+        List with one window hash per starting position
+    """
+    total = len(ids)
+    hashes = []
+    if total < n:
+        return hashes
+    h = 0
+    for j in range(n):
+        h = (h * base + ids[j] + 1) % mod
+    hashes.append(h)
+    for pos in range(1, total - n + 1):
+        h = ((h - (ids[pos - 1] + 1) * shift) * base + ids[pos + n - 1] + 1) % mod
+        hashes.append(h)
+    return hashes
+
+
+@njit(cache=True)
+def window_flag_counts(flags, n):
+    """Sliding sum of per-word flags over every n-word window.
+
+    Args:
+        flags: 1-D numeric buffer of 0/1 flags, parallel to the word ids
+        n: window width in words
+
+    Returns:
+        List with one flag count per starting position
+    """
+    total = len(flags)
+    counts = []
+    if total < n:
+        return counts
+    current = 0
+    for j in range(n):
+        current += flags[j]
+    counts.append(current)
+    for pos in range(1, total - n + 1):
+        current += flags[pos + n - 1] - flags[pos - 1]
+        counts.append(current)
+    return counts
+
+
+if _NUMBA_AVAILABLE:
+    # Warm the JIT cache once at import so first real use pays no
+    # compilation latency
+    from array import array as _array
+    _warm_ids = _array("q", [3, 1, 4, 1, 5])
+    _warm_flags = _array("b", [0, 1, 0, 1, 1])
+    ngram_hash_series(_warm_ids, 3, 257, (1 << 61) - 1, 257 * 257)
+    window_flag_counts(_warm_flags, 3)
+    del _warm_ids, _warm_flags
@@ -0,0 +1,57 @@
+"""
+Tight-loop kernel for aggregating Reddit pattern statistics.
+
+Operates on the collector's 1-D numeric columns (array('b') technique
+ids, array('d') effectiveness, array('q') upvotes) in plain index-based
+loop style so that Numba, when installed, can compile it to native code
+with @njit. Numba is strictly optional: the package carries no
+dependencies, and without it the same function runs as regular Python.
+"""
+
+try:
+    from numba import njit  # type: ignore
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def technique_sums(tech_ids, effectiveness, upvotes, technique_count):
+    """Per-technique count and sums over the pattern columns.
+
+    Args:
+        tech_ids: 1-D numeric buffer of technique ids, one per pattern
+        effectiveness: parallel buffer of effectiveness scores
+        upvotes: parallel buffer of upvote counts
+        technique_count: number of distinct technique ids
+
+    Returns:
+        (counts, effectiveness_sums, upvote_sums) lists indexed by
+        technique id
+    """
+    counts = [0 for _ in range(technique_count)]
+    effectiveness_sums = [0.0 for _ in range(technique_count)]
+    upvote_sums = [0 for _ in range(technique_count)]
+    for i in range(len(tech_ids)):
+        tech_id = tech_ids[i]
+        counts[tech_id] += 1
+        effectiveness_sums[tech_id] += effectiveness[i]
+        upvote_sums[tech_id] += upvotes[i]
+    return counts, effectiveness_sums, upvote_sums
+
+
+if _NUMBA_AVAILABLE:
+    # Warm the JIT cache once at import so first real use pays no
+    # compilation latency
+    from array import array as _array
+    technique_sums(_array("b", [0, 1, 0]), _array("d", [0.5, 0.6, 0.7]),
+                   _array("q", [10, 20, 30]), 2)
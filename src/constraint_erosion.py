@@ -6,6 +6,7 @@ over multiple conversation turns to bypass safety mechanisms.
 """
 
 import re
+from array import array
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -505,7 +506,8 @@ class ConstraintErosionDetector:
             detected_patterns=detected_patterns,
             violations=self.violations,
             boundaries=list(self.boundaries.values()),
-            timeline=self.erosion_timeline,
+            timeline_turns=array("i", (turn for turn, _ in self.erosion_timeline)),
+            timeline_scores=array("d", (score for _, score in self.erosion_timeline)),
             critical_points=critical_points,
             risk_level=self._calculate_risk_level()
         )
@@ -2,11 +2,30 @@
 Data models and types for AI Threat Scanner
 """
 
+import sys
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import islice
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Tuple
-from enum import Enum
+from typing import Iterator, NamedTuple, Optional, List, Dict, Any, Tuple
+from enum import Enum, IntEnum
+from types import MappingProxyType
 
-@dataclass
+try:
+    from ._erosion_kernels import mean_velocity, critical_turns
+except ImportError:
+    from _erosion_kernels import mean_velocity, critical_turns
+
+# dataclass(slots=True) requires Python 3.10+. On older interpreters we fall
+# back to regular dataclasses: hand-written __slots__ conflicts with dataclass
+# default values, so slotting is a best-effort optimization, not a contract.
+if sys.version_info >= (3, 10):
+    _SLOTS: Dict[str, bool] = {"slots": True}
+else:
+    _SLOTS = {}
+
+@dataclass(**_SLOTS)
 class ThreatResult:
     """Represents a detected threat"""
     threat_type: str
@@ -16,6 +35,26 @@ class ThreatResult:
     position: int = -1
     context: str = "unknown"
 
+@dataclass(frozen=True, **_SLOTS)
+class PatternCategory:
+    """Immutable attribute-access view of one pattern category.
+
+    Mirrors the category dicts in patterns.py for callers that prefer
+    category.severity over category["severity"]. context_weights is a
+    5-tuple in Context enum order (index with int(Context.X)); source
+    metadata that only some categories carry defaults to None.
+    """
+    name: str
+    patterns: Tuple[str, ...]
+    severity: int
+    description: str
+    context_weights: Tuple[float, ...]
+    clustering_weight: float
+    position_sensitivity: str
+    dataset_confidence: Optional[float] = None
+    reddit_effectiveness: Optional[float] = None
+    community_confidence: Optional[float] = None
+
 # Context types (backward compatibility)
 CONTEXT_USER_INPUT = "user_input"
 CONTEXT_LLM_RESPONSE = "llm_response"
@@ -28,12 +67,85 @@ CONTEXT_DOCUMENTATION = "documentation"
 CONTEXT_CODE_BLOCK = "code_block"
 CONTEXT_CONVERSATION = "conversation"
 
+class Context(IntEnum):
+    """Weighted scan context as a compact integer code.
+
+    Values match the column order of the packed context-weight matrix in
+    patterns.py, so int(context) indexes a weight row directly. The
+    string constants above remain the wire format; use .label to get it.
+    """
+    EDUCATIONAL = 0
+    RESEARCH = 1
+    CODE_BLOCK = 2
+    DOCUMENTATION = 3
+    USER_INPUT = 4
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def from_label(cls, label: str) -> "Context":
+        return cls[label.upper()]
+
 # Risk levels
-RISK_SAFE = "SAFE"
-RISK_LOW = "LOW"
-RISK_MEDIUM = "MEDIUM"
-RISK_HIGH = "HIGH"
-RISK_CRITICAL = "CRITICAL"
+class RiskLevel(IntEnum):
+    """Risk levels ordered by escalating severity.
+
+    Integer-valued so comparisons and sorting are C-level int operations;
+    use .label for the legacy string form.
+    """
+    SAFE = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+    @property
+    def label(self) -> str:
+        return self.name
+
+    @classmethod
+    def from_label(cls, label: str) -> "RiskLevel":
+        return cls[label.upper()]
+
+class Severity(IntEnum):
+    """Constraint violation severity as a compact integer code"""
+    MINOR = 0
+    MODERATE = 1
+    SEVERE = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def from_label(cls, label: str) -> "Severity":
+        return cls[label.upper()]
+
+class Role(IntEnum):
+    """Conversation turn role as a compact integer code"""
+    USER = 0
+    ASSISTANT = 1
+    SYSTEM = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def from_label(cls, label: str) -> "Role":
+        return cls[label.upper()]
+
+# String constants kept for backward compatibility; the enums above are the
+# single source of truth.
+RISK_SAFE = RiskLevel.SAFE.name
+RISK_LOW = RiskLevel.LOW.name
+RISK_MEDIUM = RiskLevel.MEDIUM.name
+RISK_HIGH = RiskLevel.HIGH.name
+RISK_CRITICAL = RiskLevel.CRITICAL.name
+
+_SEVERITY_INDEX = {severity.label: int(severity) for severity in Severity}
 
 # Risk level thresholds
 RISK_THRESHOLDS = {
@@ -44,9 +156,45 @@ RISK_THRESHOLDS = {
     RISK_CRITICAL: 80
 }
 
+# RISK_THRESHOLDS as sorted parallel tuples so score classification is a
+# binary search instead of an if/elif ladder
+_RISK_NAMES = (RISK_SAFE, RISK_LOW, RISK_MEDIUM, RISK_HIGH, RISK_CRITICAL)
+_RISK_CUTOFFS = tuple(RISK_THRESHOLDS[name] for name in _RISK_NAMES)
+
+def score_to_level(score: float) -> str:
+    """Map a numeric threat score to its RISK_* level name.
+
+    Args:
+        score: Threat score on the 0-100 scale
+
+    Returns:
+        One of the RISK_* level strings
+    """
+    index = bisect_right(_RISK_CUTOFFS, score) - 1
+    return _RISK_NAMES[index if index > 0 else 0]
+
+def scores_to_levels(scores) -> List[str]:
+    """Classify a whole batch of scores in one pass.
+
+    Args:
+        scores: Iterable of numeric threat scores
+
+    Returns:
+        List of RISK_* level strings, parallel to the input
+    """
+    cutoffs, names, search = _RISK_CUTOFFS, _RISK_NAMES, bisect_right
+    return [names[max(search(cutoffs, score) - 1, 0)] for score in scores]
+
+# Shared immutable defaults for rarely-populated collection fields.
+# Instances that never write the field skip allocating a fresh list/dict
+# apiece; code that does populate one must assign a real container
+# wholesale (as the analyzers already do) rather than mutate in place.
+_EMPTY_SEQ: Tuple = ()
+_EMPTY_MAP: Any = MappingProxyType({})
+
 # Smart pattern matching data structures
 
-@dataclass
+@dataclass(**_SLOTS)
 class PatternMatch:
     """Enhanced pattern match with context information"""
     pattern: str
@@ -61,28 +209,37 @@ class PatternMatch:
     is_quoted: bool = False
     is_negated: bool = False
 
-@dataclass
+@dataclass(**_SLOTS)
 class ContextMetadata:
     """Metadata about text context for smart matching"""
     primary_context: str = CONTEXT_UNKNOWN
-    secondary_contexts: List[str] = field(default_factory=list)
-    confidence_scores: Dict[str, float] = field(default_factory=dict)
-    intent_signals: List[str] = field(default_factory=list)
+    secondary_contexts: List[str] = _EMPTY_SEQ
+    confidence_scores: Dict[str, float] = field(default_factory=lambda: _EMPTY_MAP)
+    intent_signals: List[str] = _EMPTY_SEQ
     is_meta_discussion: bool = False
-    semantic_markers: Dict[str, int] = field(default_factory=dict)
+    semantic_markers: Dict[str, int] = field(default_factory=lambda: _EMPTY_MAP)
     has_quotes: bool = False
     has_negation: bool = False
 
-class IntentType(Enum):
-    """Types of intent behind patterns"""
-    EDUCATIONAL = "educational"
-    RESEARCH = "research"
-    TESTING = "testing"
-    META_DISCUSSION = "meta_discussion"
-    MALICIOUS = "malicious"
-    UNKNOWN = "unknown"
+class IntentType(IntEnum):
+    """Types of intent behind patterns.
 
-@dataclass
+    Power-of-two values so sets of intents pack into a plain int
+    bitmask: union with |, membership with &. Use .label for the
+    serialized string form.
+    """
+    UNKNOWN = 0
+    EDUCATIONAL = 1
+    RESEARCH = 2
+    TESTING = 4
+    META_DISCUSSION = 8
+    MALICIOUS = 16
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+@dataclass(**_SLOTS)
 class IntentAnalysis:
     """Analysis of intent behind patterns"""
     intent_type: IntentType = IntentType.UNKNOWN
@@ -90,16 +247,24 @@ class IntentAnalysis:
     threat_reduction: float = 0.0
     supporting_evidence: List[str] = field(default_factory=list)
 
-class WhitelistCategory(Enum):
-    """Categories of legitimate use cases"""
-    SECURITY_EDUCATION = "security_education"
-    ACADEMIC_RESEARCH = "academic_research"
-    DOCUMENTATION = "documentation"
-    TESTING_DEMO = "testing_demo"
-    META_DISCUSSION = "meta_discussion"
-    CODE_EXAMPLE = "code_example"
+class WhitelistCategory(IntEnum):
+    """Categories of legitimate use cases.
+
+    Power-of-two values for the same bitmask composition as IntentType;
+    .label yields the serialized string form.
+    """
+    SECURITY_EDUCATION = 1
+    ACADEMIC_RESEARCH = 2
+    DOCUMENTATION = 4
+    TESTING_DEMO = 8
+    META_DISCUSSION = 16
+    CODE_EXAMPLE = 32
 
-@dataclass
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+@dataclass(**_SLOTS)
 class LegitimacyAnalysis:
     """Analysis of legitimate use cases"""
     is_legitimate: bool = False
@@ -107,7 +272,7 @@ class LegitimacyAnalysis:
     category: Optional[WhitelistCategory] = None
     evidence: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_SLOTS)
 class ThreatScore:
     """Comprehensive threat scoring"""
     raw_score: float = 0.0
@@ -143,9 +308,31 @@ DEFAULT_WEIGHTS = {
     ScoringFactors.SURROUNDING_CONTEXT: 0.10,
     ScoringFactors.SEMANTIC_COHERENCE: 0.05
 }
+# DEFAULT_WEIGHTS frozen into a fixed key order and packed weight vector
+# so scoring can run one zip/dot pass instead of per-factor dict lookups
+_WEIGHT_KEYS: Tuple[str, ...] = tuple(DEFAULT_WEIGHTS)
+_WEIGHT_VEC = array("d", (DEFAULT_WEIGHTS[key] for key in _WEIGHT_KEYS))
+
+def compute_weighted_score(components) -> float:
+    """Dot score components against the default scoring weights.
+
+    Args:
+        components: Either a dict keyed by ScoringFactors names, or a
+            sequence of component scores in _WEIGHT_KEYS order
+
+    Returns:
+        Weighted sum of the components
+    """
+    if isinstance(components, dict):
+        get = components.get
+        return sum(weight * get(key, 0.0)
+                   for weight, key in zip(_WEIGHT_VEC, _WEIGHT_KEYS))
+    return sum(weight * component
+               for weight, component in zip(_WEIGHT_VEC, components))
+
 # Conversation tracking data structures
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConversationTurn:
     """Represents a single turn in a conversation"""
     turn_number: int
@@ -155,21 +342,46 @@ class ConversationTurn:
     threat_result: Optional[Any] = None  # ThreatResult or scan result dict
     context_before: str = ""
     risk_score: float = 0.0
-    detected_patterns: List[str] = field(default_factory=list)
+    detected_patterns: List[str] = _EMPTY_SEQ
     # Additional fields for replay analysis
     role: str = 'user'  # 'user', 'assistant', or 'system'
     content: str = ''  # Alias for prompt/response content
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=lambda: _EMPTY_MAP)
     
     def __post_init__(self):
-        # If content is set but prompt is not, use content as prompt
-        if self.content and not self.prompt:
-            self.prompt = self.content
-        # If prompt is set but content is not, use prompt as content
-        elif self.prompt and not self.content:
-            self.content = self.prompt
-
-@dataclass
+        # Alias prompt/content with single attribute loads and at most one
+        # write; this runs for every turn constructed during replay ingestion
+        prompt, content = self.prompt, self.content
+        if not prompt:
+            self.prompt = content
+        elif not content:
+            self.content = prompt
+
+    @classmethod
+    def from_raw(cls, turn_number: int, role: str, content: str,
+                 timestamp: Any = None,
+                 metadata: Optional[Dict[str, Any]] = None) -> 'ConversationTurn':
+        """Build a turn from already-normalized transcript fields.
+
+        Bypasses the dataclass __init__ and __post_init__ with direct
+        slot writes, which is measurably cheaper when ingesting large
+        transcripts turn by turn.
+        """
+        self = object.__new__(cls)
+        self.turn_number = turn_number
+        self.timestamp = timestamp
+        self.prompt = content
+        self.response = None
+        self.threat_result = None
+        self.context_before = ""
+        self.risk_score = 0.0
+        self.detected_patterns = _EMPTY_SEQ
+        self.role = role
+        self.content = content
+        self.metadata = metadata if metadata is not None else _EMPTY_MAP
+        return self
+
+@dataclass(**_SLOTS)
 class SessionMetadata:
     """Metadata about a conversation session"""
     session_id: str
@@ -179,7 +391,7 @@ class SessionMetadata:
     is_active: bool
     timeout_minutes: int
     
-@dataclass
+@dataclass(**_SLOTS)
 class AttackChain:
     """Represents a detected multi-step attack pattern"""
     chain_type: str
@@ -187,10 +399,10 @@ class AttackChain:
     end_turn: int
     confidence: float
     description: str
-    indicators: List[str] = field(default_factory=list)
-    severity: str = "MEDIUM"
+    indicators: List[str] = _EMPTY_SEQ
+    severity: str = RISK_MEDIUM
     
-@dataclass
+@dataclass(**_SLOTS)
 class ConversationAnalysis:
     """Complete analysis of a conversation session"""
     session_metadata: SessionMetadata
@@ -205,9 +417,21 @@ class ConversationAnalysis:
     attack_indicators: Dict[str, int]  # Pattern counts
     final_risk_level: str
     erosion_analysis: Optional[Dict[str, Any]] = None  # Erosion analysis data
-    
+    # (fingerprint, rendered dict) pair so repeated report generation
+    # reuses the last render while the analysis is unchanged
+    _dict_cache: Optional[Tuple[Any, Dict[str, Any]]] = field(default=None, repr=False)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert analysis to dictionary for reporting"""
+        fingerprint = (len(self.detected_chains), self.cumulative_risk_score,
+                       self.final_risk_level)
+        if self._dict_cache is not None and self._dict_cache[0] == fingerprint:
+            return self._dict_cache[1]
+        rendered = self._render_dict()
+        self._dict_cache = (fingerprint, rendered)
+        return rendered
+
+    def _render_dict(self) -> Dict[str, Any]:
         return {
             "session_id": self.session_metadata.session_id,
             "total_turns": self.session_metadata.total_turns,
@@ -220,11 +444,14 @@ class ConversationAnalysis:
             "detected_chains": [
                 {
                     "type": chain.chain_type,
-                    "confidence": round(chain.confidence, 2),
+                    "confidence": confidence,
                     "turns": f"{chain.start_turn}-{chain.end_turn}",
                     "description": chain.description
                 }
-                for chain in self.detected_chains
+                # Round all confidences in one pass, then stitch
+                for chain, confidence in zip(
+                    self.detected_chains,
+                    [round(c.confidence, 2) for c in self.detected_chains])
             ],
             "pivot_points": self.pivot_points,
             "attack_indicators": self.attack_indicators,
@@ -234,7 +461,7 @@ class ConversationAnalysis:
 
 # Constraint Erosion data structures
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConstraintViolation:
     """Represents a single constraint violation in conversation"""
     turn_number: int
@@ -245,7 +472,7 @@ class ConstraintViolation:
     boundary_affected: str
     confidence: float = 0.5
     
-@dataclass
+@dataclass(**_SLOTS)
 class ErosionPattern:
     """Detected erosion pattern in conversation"""
     pattern_type: str
@@ -256,7 +483,7 @@ class ErosionPattern:
     severity_trend: str  # "stable", "escalating", "decreasing"
     confidence: float = 0.5
     
-@dataclass
+@dataclass(**_SLOTS)
 class SafetyBoundary:
     """Represents a safety boundary being tracked"""
     name: str
@@ -266,7 +493,7 @@ class SafetyBoundary:
     description: str
     erosion_history: List[Dict[str, Any]] = field(default_factory=list)
     
-@dataclass
+@dataclass(**_SLOTS)
 class ErosionAnalysis:
     """Complete erosion analysis for a conversation"""
     erosion_score: float  # 0-100 scale
@@ -277,12 +504,57 @@ class ErosionAnalysis:
     detected_patterns: List[ErosionPattern]
     violations: List[ConstraintViolation]
     boundaries: List[SafetyBoundary]
-    timeline: List[Tuple[int, float]]  # (turn_number, erosion_score)
+    # Erosion timeline stored as two parallel packed arrays instead of a
+    # list of (turn, score) tuples; use the timeline property for the
+    # legacy tuple view
+    timeline_turns: array  # turn numbers ('i')
+    timeline_scores: array  # erosion score per turn ('d')
     critical_points: List[int]  # Turn numbers where erosion accelerated
     risk_level: str  # SAFE, LOW, MEDIUM, HIGH, CRITICAL
-    
+    # Running severity histogram, indexed by Severity; maintained by
+    # add_violation so to_dict never has to rescan the violations list
+    violation_severity_counts: List[int] = field(default_factory=lambda: [0, 0, 0])
+    # (fingerprint, rendered dict) cache mirroring ConversationAnalysis
+    _dict_cache: Optional[Tuple[Any, Dict[str, Any]]] = field(default=None, repr=False)
+
+    @property
+    def timeline(self) -> List[Tuple[int, float]]:
+        """Legacy (turn_number, erosion_score) tuple view of the timeline"""
+        return list(zip(self.timeline_turns, self.timeline_scores))
+
+    @timeline.setter
+    def timeline(self, points: List[Tuple[int, float]]) -> None:
+        self.timeline_turns = array("i", (turn for turn, _ in points))
+        self.timeline_scores = array("d", (score for _, score in points))
+
+    def compute_velocity(self) -> float:
+        """Mean per-turn change of the erosion score series"""
+        return mean_velocity(self.timeline_scores)
+
+    def detect_critical_points(self, level: float = 50.0, spike_ratio: float = 2.0,
+                               spike_floor: float = 20.0) -> List[int]:
+        """Find critical turns from the timeline with one kernel pass"""
+        return list(critical_turns(self.timeline_turns, self.timeline_scores,
+                                   level, spike_ratio, spike_floor))
+
+    def add_violation(self, violation: ConstraintViolation) -> None:
+        """Record a violation and update the severity histogram"""
+        self.violations.append(violation)
+        index = _SEVERITY_INDEX.get(violation.severity)
+        if index is not None:
+            self.violation_severity_counts[index] += 1
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert analysis to dictionary for reporting"""
+        fingerprint = (len(self.violations), len(self.detected_patterns),
+                       self.erosion_score, self.risk_level)
+        if self._dict_cache is not None and self._dict_cache[0] == fingerprint:
+            return self._dict_cache[1]
+        rendered = self._render_dict()
+        self._dict_cache = (fingerprint, rendered)
+        return rendered
+
+    def _render_dict(self) -> Dict[str, Any]:
         return {
             "erosion_score": round(self.erosion_score, 2),
             "erosion_velocity": round(self.erosion_velocity, 2),
@@ -296,16 +568,14 @@ class ErosionAnalysis:
                     "occurrences": p.occurrence_count,
                     "turns": f"{p.first_occurrence}-{p.last_occurrence}",
                     "trend": p.severity_trend,
-                    "confidence": round(p.confidence, 2)
+                    "confidence": confidence
                 }
-                for p in self.detected_patterns
+                # Single rounding pass over the confidences, then stitch
+                for p, confidence in zip(
+                    self.detected_patterns,
+                    [round(p.confidence, 2) for p in self.detected_patterns])
             ],
-            "violations_summary": {
-                "total": len(self.violations),
-                "minor": sum(1 for v in self.violations if v.severity == "minor"),
-                "moderate": sum(1 for v in self.violations if v.severity == "moderate"),
-                "severe": sum(1 for v in self.violations if v.severity == "severe")
-            },
+            "violations_summary": self._violations_summary(),
             "boundaries_status": [
                 {
                     "name": b.name,
@@ -316,9 +586,27 @@ class ErosionAnalysis:
             ],
             "critical_points": self.critical_points
         }
+
+    def _violations_summary(self) -> Dict[str, int]:
+        """Summarize violation severities from the running histogram"""
+        counts = self.violation_severity_counts
+        if self.violations and not any(counts):
+            # Violations were assigned directly rather than through
+            # add_violation; histogram them once.
+            counts = [0] * len(Severity)
+            for violation in self.violations:
+                index = _SEVERITY_INDEX.get(violation.severity)
+                if index is not None:
+                    counts[index] += 1
+        return {
+            "total": len(self.violations),
+            "minor": counts[Severity.MINOR],
+            "moderate": counts[Severity.MODERATE],
+            "severe": counts[Severity.SEVERE]
+        }
 # Replay Analysis data structures
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConversationHistory:
     """Complete conversation history for replay analysis"""
     conversation_id: Optional[str] = None
@@ -338,13 +626,113 @@ class ConversationHistory:
         
     def get_user_turns(self) -> List['ConversationTurn']:
         """Get all user turns from the conversation"""
-        return [t for t in self.turns if hasattr(t, 'role') and t.role == 'user']
-        
+        # ConversationTurn always defines role, so no hasattr guard; getattr
+        # keeps duck-typed turn objects working without exception machinery
+        return [t for t in self.turns if getattr(t, 'role', None) == 'user']
+
     def get_assistant_turns(self) -> List['ConversationTurn']:
         """Get all assistant turns from the conversation"""
-        return [t for t in self.turns if hasattr(t, 'role') and t.role == 'assistant']
+        return [t for t in self.turns if getattr(t, 'role', None) == 'assistant']
+
+# Role codes for columnar storage: packed into one byte per turn so role
+# filters compare integers instead of strings.
+_ROLE_CODES = {role.label: int(role) for role in Role}
+_ROLE_NAMES = tuple(role.label for role in Role)
+
+class ConversationHistoryColumnar:
+    """Column-oriented conversation history for replay-time scans.
 
-@dataclass
+    Stores one column per turn field instead of a list of ConversationTurn
+    objects, so scans that need only roles or risk scores (role filtering,
+    risk aggregation, pattern counting) walk compact packed arrays rather
+    than pulling every 12-field turn object through the cache.
+    ConversationTurn objects are materialized on demand via __getitem__.
+    """
+
+    __slots__ = (
+        "conversation_id", "metadata",
+        "turn_numbers", "roles", "risk_scores",
+        "timestamps", "contents", "responses", "contexts_before",
+        "threat_results", "detected_patterns", "turn_metadata",
+    )
+
+    def __init__(self, conversation_id: Optional[str] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        self.conversation_id = conversation_id
+        self.metadata = metadata if metadata is not None else {}
+        # Packed numeric columns
+        self.turn_numbers = array("i")
+        self.roles = array("B")  # codes from _ROLE_CODES
+        self.risk_scores = array("d")
+        # Object columns (one entry per turn)
+        self.timestamps: List[Any] = []
+        self.contents: List[str] = []
+        self.responses: List[Optional[str]] = []
+        self.contexts_before: List[str] = []
+        self.threat_results: List[Optional[Any]] = []
+        self.detected_patterns: List[List[str]] = []
+        self.turn_metadata: List[Dict[str, Any]] = []
+
+    @classmethod
+    def from_history(cls, history: "ConversationHistory") -> "ConversationHistoryColumnar":
+        """Build columnar storage from an existing ConversationHistory"""
+        columnar = cls(conversation_id=history.conversation_id,
+                       metadata=history.metadata)
+        for turn in history.turns:
+            columnar.add_turn(turn)
+        return columnar
+
+    def add_turn(self, turn: "ConversationTurn") -> None:
+        """Append a turn, scattering its fields into the columns"""
+        self.turn_numbers.append(turn.turn_number)
+        self.roles.append(_ROLE_CODES.get(turn.role, len(_ROLE_NAMES)))
+        self.risk_scores.append(turn.risk_score)
+        self.timestamps.append(turn.timestamp)
+        self.contents.append(turn.content or turn.prompt)
+        self.responses.append(turn.response)
+        self.contexts_before.append(turn.context_before)
+        self.threat_results.append(turn.threat_result)
+        self.detected_patterns.append(turn.detected_patterns)
+        self.turn_metadata.append(turn.metadata)
+
+    def __len__(self) -> int:
+        return len(self.turn_numbers)
+
+    def __getitem__(self, index: int) -> "ConversationTurn":
+        """Materialize a transient ConversationTurn view of row `index`"""
+        role_code = self.roles[index]
+        return ConversationTurn(
+            turn_number=self.turn_numbers[index],
+            timestamp=self.timestamps[index],
+            prompt=self.contents[index],
+            response=self.responses[index],
+            threat_result=self.threat_results[index],
+            context_before=self.contexts_before[index],
+            risk_score=self.risk_scores[index],
+            detected_patterns=self.detected_patterns[index],
+            role=_ROLE_NAMES[role_code] if role_code < len(_ROLE_NAMES) else "user",
+            content=self.contents[index],
+            metadata=self.turn_metadata[index],
+        )
+
+    def __iter__(self) -> Iterator["ConversationTurn"]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def role_indices(self, role: str) -> List[int]:
+        """Get row indices for a role without materializing turn objects"""
+        code = _ROLE_CODES.get(role, -1)
+        return [i for i, r in enumerate(self.roles) if r == code]
+
+    def get_user_turns(self) -> List["ConversationTurn"]:
+        """Get all user turns from the conversation"""
+        return [self[i] for i in self.role_indices("user")]
+
+    def get_assistant_turns(self) -> List["ConversationTurn"]:
+        """Get all assistant turns from the conversation"""
+        return [self[i] for i in self.role_indices("assistant")]
+
+@dataclass(**_SLOTS)
 class ReplayAnalysis:
     """Results from retrospective conversation analysis"""
     conversation_id: str
@@ -361,52 +749,87 @@ class ReplayAnalysis:
     correlations: Dict[str, Any]
     risk_assessment: Dict[str, Any]
     metadata: Dict[str, Any] = field(default_factory=dict)
-    
+    # (attack count, rendered summary) cache for repeated report passes
+    _summary_cache: Optional[Tuple[int, Dict[str, int]]] = field(default=None, repr=False)
+
     def get_critical_attacks(self) -> List[Dict[str, Any]]:
         """Get only critical severity attacks"""
         return [a for a in self.detected_attacks if a.get('severity') == 'critical']
-        
+
     def get_attack_summary(self) -> Dict[str, int]:
         """Get summary of attack types detected"""
-        summary = {}
-        for attack in self.detected_attacks:
-            attack_type = attack.get('type', 'unknown')
-            summary[attack_type] = summary.get(attack_type, 0) + 1
+        count = len(self.detected_attacks)
+        if self._summary_cache is not None and self._summary_cache[0] == count:
+            return self._summary_cache[1]
+        summary = dict(Counter(attack.get('type', 'unknown')
+                               for attack in self.detected_attacks))
+        self._summary_cache = (count, summary)
         return summary
 
-@dataclass
+class TimelineEvent(NamedTuple):
+    """A single attack event on the timeline.
+
+    Tuple-backed so each event is one compact object and field access is
+    an index load instead of a per-key dict hash lookup.
+    """
+    turn: int
+    timestamp: Optional[str]
+    event_type: str
+    description: str
+    severity: str = "low"
+    success: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert event to dictionary for serialization"""
+        return self._asdict()
+
+@dataclass(**_SLOTS)
 class AttackTimeline:
     """Chronological timeline of attack events"""
-    events: List[Dict[str, Any]] = field(default_factory=list)
-    
-    def add_event(self, turn: int, event_type: str, description: str, 
+    events: List[TimelineEvent] = field(default_factory=list)
+    # Events bucketed by severity at insertion time so severity filters are
+    # dict lookups instead of full timeline scans
+    _severity_index: Dict[str, List[TimelineEvent]] = field(default_factory=dict, repr=False)
+    # Cached turn-ordered view of events, rebuilt only when the timeline
+    # has changed since the last summary
+    _sorted: List[TimelineEvent] = field(default_factory=list, repr=False)
+    _dirty: bool = field(default=True, repr=False)
+
+    def add_event(self, turn: int, event_type: str, description: str,
                   severity: str = "low", timestamp: Optional[str] = None) -> None:
         """Add an event to the timeline"""
-        self.events.append({
-            'turn': turn,
-            'timestamp': timestamp,
-            'event_type': event_type,
-            'description': description,
-            'severity': severity,
-            'success': False
-        })
-        
-    def get_events_by_severity(self, severity: str) -> List[Dict[str, Any]]:
+        event = TimelineEvent(
+            turn=turn,
+            timestamp=timestamp,
+            event_type=event_type,
+            description=description,
+            severity=severity,
+        )
+        self.events.append(event)
+        self._severity_index.setdefault(severity, []).append(event)
+        self._dirty = True
+
+    def get_events_by_severity(self, severity: str) -> List[TimelineEvent]:
         """Get events filtered by severity level"""
-        return [e for e in self.events if e.get('severity') == severity]
-        
+        if self._severity_index or not self.events:
+            return list(self._severity_index.get(severity, []))
+        # Events were assigned directly rather than through add_event
+        return [e for e in self.events if e.severity == severity]
+
     def get_timeline_summary(self) -> str:
         """Generate a text summary of the timeline"""
         if not self.events:
             return "No events detected"
-            
-        summary_lines = []
-        for event in sorted(self.events, key=lambda x: x['turn']):
-            line = f"Turn {event['turn']}: [{event['severity'].upper()}] {event['event_type']} - {event['description']}"
-            summary_lines.append(line)
-        return "\n".join(summary_lines)
 
-@dataclass
+        if self._dirty or len(self._sorted) != len(self.events):
+            self._sorted = sorted(self.events, key=lambda x: x.turn)
+            self._dirty = False
+        return "\n".join(
+            f"Turn {event.turn}: [{event.severity.upper()}] {event.event_type} - {event.description}"
+            for event in self._sorted
+        )
+
+@dataclass(**_SLOTS)
 class ThreatActor:
     """Profile of an attacker based on behavior analysis"""
     actor_id: str
@@ -419,30 +842,68 @@ class ThreatActor:
     last_seen: Optional[str] = None
     total_attacks: int = 0
     successful_attacks: int = 0
-    
+    # Attack counts the cached success_rate was computed from; lets
+    # update_success_rate skip the recompute when nothing changed
+    _rate_counts: Tuple[int, int] = field(default=(-1, -1), repr=False)
+    # (fingerprint, rendered summary) cache for repeated profile reads
+    _profile_cache: Optional[Tuple[Any, Dict[str, Any]]] = field(default=None, repr=False)
+    # Set mirror of preferred_techniques for O(1) dedup in add_technique
+    _technique_set: Optional[set] = field(default=None, repr=False)
+
     def update_success_rate(self) -> None:
         """Update success rate based on attack outcomes"""
+        counts = (self.successful_attacks, self.total_attacks)
+        if counts == self._rate_counts:
+            return
         if self.total_attacks > 0:
             self.success_rate = (self.successful_attacks / self.total_attacks) * 100
         else:
             self.success_rate = 0.0
+        self._rate_counts = counts
             
     def add_technique(self, technique: str) -> None:
         """Add a newly observed technique"""
-        if technique not in self.preferred_techniques:
+        seen = self._technique_set
+        if seen is None or len(seen) != len(self.preferred_techniques):
+            # First call, or the list was replaced wholesale: rebuild the
+            # membership set so lookups stay O(1)
+            seen = self._technique_set = set(self.preferred_techniques)
+        if technique not in seen:
+            seen.add(technique)
             self.preferred_techniques.append(technique)
             
     def get_profile_summary(self) -> Dict[str, Any]:
         """Get a summary of the threat actor profile"""
-        return {
+        fingerprint = (self.sophistication_level, len(self.preferred_techniques),
+                       self.success_rate, self.persistence_score, self.total_attacks)
+        if self._profile_cache is not None and self._profile_cache[0] == fingerprint:
+            return self._profile_cache[1]
+        summary = {
             'actor_id': self.actor_id,
             'sophistication': self.sophistication_level,
-            'top_techniques': self.preferred_techniques[:3],
+            'top_techniques': tuple(islice(self.preferred_techniques, 3)),
             'success_rate': round(self.success_rate, 2),
             'persistence': round(self.persistence_score, 2),
             'total_attacks': self.total_attacks
         }
+        self._profile_cache = (fingerprint, summary)
+        return summary
 
 # Extended ConversationTurn for replay analysis compatibility
 # Note: ConversationTurn already exists but we extend it with additional attributes
-# dynamically when needed in replay_analyzer.py
\ No newline at end of file
+# dynamically when needed in replay_analyzer.py
+
+# Intern the hot comparison literals once at module load so role, severity,
+# and context equality checks short-circuit on pointer identity instead of
+# falling through to a character compare.
+for _literal in (
+    CONTEXT_USER_INPUT, CONTEXT_LLM_RESPONSE, CONTEXT_UNKNOWN,
+    CONTEXT_EDUCATIONAL, CONTEXT_RESEARCH, CONTEXT_DOCUMENTATION,
+    CONTEXT_CODE_BLOCK, CONTEXT_CONVERSATION,
+    RISK_SAFE, RISK_LOW, RISK_MEDIUM, RISK_HIGH, RISK_CRITICAL,
+    "user", "assistant", "system",
+    "minor", "moderate", "severe",
+    "low", "medium", "high", "critical",
+):
+    sys.intern(_literal)
+del _literal
\ No newline at end of file
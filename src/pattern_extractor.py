@@ -9,26 +9,238 @@ This module provides functionality to:
 - Build comprehensive pattern libraries from dataset analysis
 """
 
+import heapq
 import re
 import json
-from typing import Dict, List, Set, Tuple, Optional, Any
+import sys
+from array import array
+from typing import Dict, Iterable, List, Set, Tuple, Optional, Any
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-import difflib
 from datetime import datetime
+from itertools import chain
 
 # Import our modules
 try:
     # Try relative imports first (when used as module)
     from .dataset_loader import DatasetPrompt, DatasetManager
+    from ._extract_kernels import ngram_hash_series, window_flag_counts
+    from ._aho_corasick import AhoCorasick
 except ImportError:
     # Fall back to absolute imports (when run directly)
     from dataset_loader import DatasetPrompt, DatasetManager
+    from _extract_kernels import ngram_hash_series, window_flag_counts
+    from _aho_corasick import AhoCorasick
 
 # Note: Categories are handled as strings, no need for ThreatCategory enum
 
+# Optional acceleration: orjson serializes JSON several times faster than
+# the stdlib and emits bytes directly. The extractor stays zero-dependency;
+# orjson is used only when already present.
+try:
+    import orjson as _orjson  # type: ignore
+except ImportError:
+    _orjson = None
+
+# Slotted dataclasses need Python 3.10+; on older interpreters the
+# classes fall back to regular __dict__ storage
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Common attack keywords to look for
+_ATTACK_KEYWORDS = (
+    'ignore', 'override', 'bypass', 'reveal', 'show', 'display',
+    'system', 'prompt', 'instruction', 'admin', 'developer',
+    'mode', 'debug', 'emergency', 'urgent', 'hack', 'jailbreak',
+    'DAN', 'STAN', 'unrestricted', 'no filter', 'no restriction',
+    'training', 'dataset', 'configuration', 'settings', 'rules'
+)
+
+# Common attack phrases
+_ATTACK_PHRASES = (
+    'ignore all previous', 'ignore previous instructions',
+    'disregard all', 'forget everything',
+    'system prompt', 'show me your', 'reveal your',
+    'developer mode', 'debug mode', 'admin mode',
+    'do anything now', 'no restrictions', 'bypass safety',
+    'as an ai', 'as a language model', 'i cannot',
+    'emergency override', 'urgent request', 'critical update',
+    'new instructions', 'updated instructions', 'revised rules'
+)
+
+
+# Attack indicator substrings: an n-gram is only a candidate phrase if
+# one of its words contains one of these
+_ATTACK_INDICATORS = (
+    'ignore', 'override', 'bypass', 'system', 'prompt',
+    'admin', 'debug', 'mode', 'instruction', 'reveal'
+)
+
+# One compiled alternation over the indicators: a single C-level regex
+# probe instead of a Python generator over ten substring checks
+_ATTACK_IND_RE = re.compile('|'.join(_ATTACK_INDICATORS))
+
+# Frequent benign openers that are never counted as attack phrases
+_COMMON_PHRASES = frozenset({
+    'i want to', 'can you please', 'thank you for',
+    'i need to', 'would you mind', 'could you help',
+    'is it possible', 'how can i', 'what is the'
+})
+
+# At most this many stored examples per key: emission truncates to five
+# anyway, so keeping more would only burn memory on large corpora
+_MAX_EXAMPLES = 5
+
+# Rolling polynomial hash parameters for n-gram counting (Mersenne prime
+# modulus keeps Python int arithmetic in the fast single-digit range)
+_HASH_MOD = (1 << 61) - 1
+_HASH_BASE = 1_000_003
+_HASH_SHIFT = {n: pow(_HASH_BASE, n - 1, _HASH_MOD) for n in (3, 4, 5)}
+
+
+# Structural markers: (regex, pattern type, description, caseless). The
+# caseless markers scan the shared lowercase text without IGNORECASE;
+# the uppercase markers are case-significant and scan the original text
+_STRUCTURAL_PATTERNS = (
+    (r'\[\[.*?\]\]', 'double_brackets', 'Special bracket notation', True),
+    (r'#{3,}.*?#{3,}', 'hash_markers', 'Hash-marked sections', True),
+    (r'<system>.*?</system>', 'xml_tags', 'XML-style tags', True),
+    (r'```.*?```', 'code_blocks', 'Code block markers', True),
+    (r'ADMIN|SYSTEM|DEBUG|EMERGENCY', 'caps_keywords', 'Uppercase keywords', False),
+    (r'!!+|###+|\*\*\*+', 'emphasis_markers', 'Emphasis markers', True),
+    (r'\\u[0-9a-fA-F]{4}', 'unicode_escape', 'Unicode escapes', True),
+    (r'[A-Z]{2,}[\s_][A-Z]{2,}', 'caps_commands', 'Uppercase commands', False),
+)
+
+# Lookup from pattern type back to its regex and description
+_STRUCT_INFO = {ptype: (rx, desc) for rx, ptype, desc, _ in _STRUCTURAL_PATTERNS}
+
+
+def _dedup_head(items, limit: Optional[int] = 10) -> List[Any]:
+    """
+    First `limit` distinct items in encounter order.
+
+    Stops consuming the iterable as soon as the limit is reached, so
+    merging large clusters never materializes the full combined list.
+    Pass limit=None to deduplicate without a cap.
+    """
+    seen = set()
+    out: List[Any] = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+            if limit is not None and len(out) == limit:
+                break
+    return out
+
 
-@dataclass
+# Keyword groups used to infer a category for keyword patterns
+_CATEGORY_KEYWORDS = {
+    'prompt_injection': ['ignore', 'override', 'system', 'prompt', 'instruction'],
+    'jailbreak': ['DAN', 'STAN', 'unrestricted', 'mode', 'developer', 'debug'],
+    'data_extraction': ['reveal', 'show', 'display', 'training', 'dataset'],
+    'manipulation': ['admin', 'emergency', 'urgent', 'critical']
+}
+
+# Inverted once at import: lowercase keyword -> category, first match
+# winning like the original group order
+_KEYWORD_CATEGORY: Dict[str, str] = {}
+for _category, _keywords in _CATEGORY_KEYWORDS.items():
+    for _keyword in _keywords:
+        _KEYWORD_CATEGORY.setdefault(_keyword.lower(), _category)
+del _category, _keywords, _keyword
+
+# Technique name -> category
+_TECHNIQUE_CATEGORY = {
+    'instruction_override': 'prompt_injection',
+    'role_play': 'jailbreak',
+    'direct_query': 'data_extraction',
+    'authority_claim': 'manipulation',
+    'base64': 'encoding',
+    'gradual_erosion': 'multi_turn',
+    'context_switching': 'confusion'
+}
+
+
+# Tags distinguishing what a combined-automaton match came from
+_TAG_KEYWORD = 'k'
+_TAG_PHRASE = 'p'
+
+
+def _build_combined_automaton() -> AhoCorasick:
+    """Build one automaton over attack keywords and phrases together.
+
+    Payloads are (tag, original entry) tuples so a single pass over each
+    prompt serves both the keyword and the phrase extractors.
+    """
+    automaton = AhoCorasick()
+    for keyword in _ATTACK_KEYWORDS:
+        automaton.add_word(keyword.lower(), (_TAG_KEYWORD, keyword))
+    for phrase in _ATTACK_PHRASES:
+        automaton.add_word(phrase.lower(), (_TAG_PHRASE, phrase))
+    automaton.build()
+    return automaton
+
+
+def _jaro_winkler(text1: str, text2: str, prefix_scale: float = 0.1) -> float:
+    """
+    Jaro-Winkler similarity between two strings (0-1).
+
+    Runs in near-linear time for the short pattern strings compared
+    during clustering, unlike difflib's quadratic Ratcliff-Obershelp.
+    """
+    if text1 == text2:
+        return 1.0
+    len1 = len(text1)
+    len2 = len(text2)
+    if not len1 or not len2:
+        return 0.0
+
+    match_range = max(len1, len2) // 2 - 1
+    if match_range < 1:
+        match_range = 1
+    flags1 = [False] * len1
+    flags2 = [False] * len2
+
+    matches = 0
+    for i, char in enumerate(text1):
+        start = i - match_range
+        if start < 0:
+            start = 0
+        for j in range(start, min(i + match_range + 1, len2)):
+            if not flags2[j] and text2[j] == char:
+                flags1[i] = True
+                flags2[j] = True
+                matches += 1
+                break
+    if not matches:
+        return 0.0
+
+    transpositions = 0
+    j = 0
+    for i in range(len1):
+        if flags1[i]:
+            while not flags2[j]:
+                j += 1
+            if text1[i] != text2[j]:
+                transpositions += 1
+            j += 1
+    transpositions //= 2
+
+    jaro = (matches / len1 + matches / len2
+            + (matches - transpositions) / matches) / 3
+
+    # Winkler boost for a shared prefix of up to 4 characters
+    prefix = 0
+    for char1, char2 in zip(text1, text2):
+        if char1 != char2 or prefix == 4:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1.0 - jaro)
+
+
+@dataclass(**_SLOTS)
 class ExtractedPattern:
     """Represents an extracted attack pattern."""
     pattern: str
@@ -58,7 +270,7 @@ class ExtractedPattern:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PatternCluster:
     """Represents a cluster of similar patterns."""
     id: str
@@ -96,21 +308,62 @@ class PatternExtractor:
         self.extracted_patterns: List[ExtractedPattern] = []
         self.pattern_clusters: List[PatternCluster] = []
         self.statistics: Dict[str, Any] = {}
+        # One automaton over keywords and phrases together, built once:
+        # each prompt is scanned in a single pass that serves both the
+        # keyword and the phrase extractor
+        self._combined_ac = _build_combined_automaton()
+        # Word interning shared across extractions: tokens map to small
+        # int ids, and each unique word is checked against the attack
+        # indicators exactly once, ever
+        self._word_ids: Dict[str, int] = {}
+        self._id_words: List[str] = []
+        self._indicator_flags: List[int] = []
+        # Structural markers compiled once: a combined alternation as a
+        # quick rejection filter, plus the individual patterns for exact
+        # per-type counting (the alternation alone would let an earlier
+        # alternative swallow text that also matches a later one). The
+        # per-type patterns are split by case sensitivity so none of
+        # them pays for IGNORECASE case folding.
+        self._struct_re = re.compile(
+            '|'.join(f'(?:{rx})' for rx, _, _, _ in _STRUCTURAL_PATTERNS),
+            re.IGNORECASE | re.DOTALL
+        )
+        self._struct_lower_res = tuple(
+            (re.compile(rx, re.DOTALL), ptype)
+            for rx, ptype, _, caseless in _STRUCTURAL_PATTERNS if caseless
+        )
+        self._struct_cased_res = tuple(
+            (re.compile(rx, re.DOTALL), ptype)
+            for rx, ptype, _, caseless in _STRUCTURAL_PATTERNS if not caseless
+        )
     
-    def extract_patterns(self, prompts: List[DatasetPrompt]) -> List[ExtractedPattern]:
+    def extract_patterns(self, prompts: Iterable[DatasetPrompt]) -> List[ExtractedPattern]:
         """
-        Extract patterns from a list of prompts.
-        
+        Extract patterns from a collection of prompts.
+
         Args:
-            prompts: List of DatasetPrompt objects
-        
+            prompts: Iterable of DatasetPrompt objects
+
         Returns:
             List of ExtractedPattern objects
         """
+        # The extraction passes each walk the corpus, so a streaming
+        # source is drained once up front; per-key example storage below
+        # is capped, keeping everything else bounded by unique keys
+        if not isinstance(prompts, list):
+            prompts = list(prompts)
+        # Lowercase and tokenize each prompt exactly once; every
+        # downstream pass reads from these shared lists
+        lower_texts = [prompt.prompt.lower() for prompt in prompts]
+        token_ids = self._tokenize(lower_texts)
+
+        # One combined scan per prompt feeds both lexical extractors
+        keyword_hits, phrase_hits = self._scan_prompts(prompts, lower_texts)
+
         # Extract various types of patterns
-        keyword_patterns = self._extract_keyword_patterns(prompts)
-        phrase_patterns = self._extract_phrase_patterns(prompts)
-        structural_patterns = self._extract_structural_patterns(prompts)
+        keyword_patterns = self._extract_keyword_patterns(prompts, keyword_hits)
+        phrase_patterns = self._extract_phrase_patterns(prompts, phrase_hits, token_ids)
+        structural_patterns = self._extract_structural_patterns(prompts, lower_texts)
         technique_patterns = self._extract_technique_patterns(prompts)
         
         # Combine all patterns
@@ -127,37 +380,69 @@ class PatternExtractor:
         
         return self.extracted_patterns
     
-    def _extract_keyword_patterns(self, prompts: List[DatasetPrompt]) -> List[ExtractedPattern]:
+    def _scan_prompts(self, prompts: List[DatasetPrompt],
+                      lower_texts: Optional[List[str]] = None
+                      ) -> Tuple[List[Set[str]], List[Set[str]]]:
+        """
+        Run the combined automaton over every prompt once.
+
+        Args:
+            prompts: Prompts to scan
+            lower_texts: Optional pre-lowercased prompt texts to reuse
+
+        Returns:
+            Parallel lists of per-prompt keyword and phrase match sets
+        """
+        if lower_texts is None:
+            lower_texts = [prompt.prompt.lower() for prompt in prompts]
+        keyword_hits: List[Set[str]] = []
+        phrase_hits: List[Set[str]] = []
+        for text_lower in lower_texts:
+            keywords: Set[str] = set()
+            phrases: Set[str] = set()
+            for _, (tag, entry) in self._combined_ac.iter(text_lower):
+                if tag == _TAG_KEYWORD:
+                    keywords.add(entry)
+                else:
+                    phrases.add(entry)
+            keyword_hits.append(keywords)
+            phrase_hits.append(phrases)
+        return keyword_hits, phrase_hits
+
+    def _extract_keyword_patterns(self, prompts: List[DatasetPrompt],
+                                  keyword_hits: Optional[List[Set[str]]] = None
+                                  ) -> List[ExtractedPattern]:
         """Extract keyword-based patterns."""
+        if keyword_hits is None:
+            keyword_hits, _ = self._scan_prompts(prompts)
         keyword_counter = Counter()
+        # Only the first few examples per keyword are ever emitted, so
+        # storage is capped there instead of growing with every match
         keyword_examples = defaultdict(list)
-        keyword_success = defaultdict(list)
-        
-        # Common attack keywords to look for
-        attack_keywords = [
-            'ignore', 'override', 'bypass', 'reveal', 'show', 'display',
-            'system', 'prompt', 'instruction', 'admin', 'developer',
-            'mode', 'debug', 'emergency', 'urgent', 'hack', 'jailbreak',
-            'DAN', 'STAN', 'unrestricted', 'no filter', 'no restriction',
-            'training', 'dataset', 'configuration', 'settings', 'rules'
-        ]
-        
+        # Per-keyword [trials, successes] running totals, so the success
+        # rate comes out of the same corpus traversal instead of a
+        # per-keyword list of booleans reduced afterwards
+        keyword_success: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+
         patterns = []
-        
-        for prompt in prompts:
-            text_lower = prompt.prompt.lower()
-            for keyword in attack_keywords:
-                if keyword.lower() in text_lower:
-                    keyword_counter[keyword] += 1
-                    keyword_examples[keyword].append(prompt.prompt)
-                    if prompt.success is not None:
-                        keyword_success[keyword].append(prompt.success)
-        
+
+        for prompt, hits in zip(prompts, keyword_hits):
+            success = prompt.success
+            for keyword in hits:
+                keyword_counter[keyword] += 1
+                examples = keyword_examples[keyword]
+                if len(examples) < _MAX_EXAMPLES:
+                    examples.append(prompt.prompt)
+                if success is not None:
+                    totals = keyword_success[keyword]
+                    totals[0] += 1
+                    totals[1] += success
+
         # Create patterns from frequent keywords
         for keyword, count in keyword_counter.items():
             if count >= self.min_frequency:
-                effectiveness = (sum(keyword_success[keyword]) / len(keyword_success[keyword])) \
-                    if keyword_success[keyword] else 0.0
+                trials, successes = keyword_success[keyword]
+                effectiveness = successes / trials if trials else 0.0
                 
                 pattern = ExtractedPattern(
                     pattern=f"Contains '{keyword}'",
@@ -173,56 +458,142 @@ class PatternExtractor:
         
         return patterns
     
-    def _extract_phrase_patterns(self, prompts: List[DatasetPrompt]) -> List[ExtractedPattern]:
+    def _intern_word(self, word: str) -> int:
+        """Map a token to its shared small int id, assigning on first use."""
+        wid = self._word_ids.get(word)
+        if wid is None:
+            wid = len(self._id_words)
+            self._word_ids[word] = wid
+            self._id_words.append(word)
+            self._indicator_flags.append(
+                1 if _ATTACK_IND_RE.search(word) is not None else 0)
+        return wid
+
+    def _tokenize(self, lower_texts: List[str]) -> List[array]:
+        """Split each pre-lowercased text once into interned word ids."""
+        intern_word = self._intern_word
+        return [
+            array('q', (intern_word(word) for word in text.split()))
+            for text in lower_texts
+        ]
+
+    def _extract_phrase_patterns(self, prompts: List[DatasetPrompt],
+                                 phrase_hits: Optional[List[Set[str]]] = None,
+                                 token_ids: Optional[List[array]] = None
+                                 ) -> List[ExtractedPattern]:
         """Extract common phrase patterns."""
+        if phrase_hits is None or token_ids is None:
+            lower_texts = [prompt.prompt.lower() for prompt in prompts]
+            if phrase_hits is None:
+                _, phrase_hits = self._scan_prompts(prompts, lower_texts)
+            if token_ids is None:
+                token_ids = self._tokenize(lower_texts)
         phrase_counter = Counter()
         phrase_examples = defaultdict(list)
-        phrase_categories = defaultdict(list)
-        
-        # Common attack phrases
-        attack_phrases = [
-            'ignore all previous', 'ignore previous instructions',
-            'disregard all', 'forget everything',
-            'system prompt', 'show me your', 'reveal your',
-            'developer mode', 'debug mode', 'admin mode',
-            'do anything now', 'no restrictions', 'bypass safety',
-            'as an ai', 'as a language model', 'i cannot',
-            'emergency override', 'urgent request', 'critical update',
-            'new instructions', 'updated instructions', 'revised rules'
-        ]
-        
+        phrase_categories: Dict[str, Counter] = defaultdict(Counter)
+
         patterns = []
-        
-        for prompt in prompts:
-            text_lower = prompt.prompt.lower()
-            
-            # Check predefined phrases
-            for phrase in attack_phrases:
-                if phrase in text_lower:
-                    phrase_counter[phrase] += 1
-                    phrase_examples[phrase].append(prompt.prompt)
-                    if prompt.category:
-                        phrase_categories[phrase].append(prompt.category)
-            
-            # Extract n-grams (3-5 words)
-            words = text_lower.split()
+
+        indicator_flags = self._indicator_flags
+
+        common_hashes = set()
+        for common in _COMMON_PHRASES:
+            common_ids = array('q', (self._intern_word(word) for word in common.split()))
+            width = len(common_ids)
+            common_hashes.update(ngram_hash_series(
+                common_ids, width, _HASH_BASE, _HASH_MOD,
+                pow(_HASH_BASE, width - 1, _HASH_MOD)))
+
+        # Hashes of predefined phrases that also surface as n-grams, so
+        # their counts merge into the string key before top-K selection
+        predef_hashes: Dict[int, str] = {}
+        for phrase in _ATTACK_PHRASES:
+            phrase_words = phrase.split()
+            width = len(phrase_words)
+            if 3 <= width <= 5:
+                phrase_ids = array('q', (self._intern_word(word) for word in phrase_words))
+                predef_hashes[ngram_hash_series(
+                    phrase_ids, width, _HASH_BASE, _HASH_MOD,
+                    _HASH_SHIFT[width])[0]] = phrase
+
+        # First pass keeps nothing but counts per n-gram hash; words,
+        # examples and categories are gathered in a second pass for the
+        # few dozen hashes that survive top-K selection
+        ngram_counter: Dict[int, int] = Counter()
+
+        for prompt, hits, ids in zip(prompts, phrase_hits, token_ids):
+            # Predefined phrase matches come from the shared combined scan
+            for phrase in hits:
+                phrase_counter[phrase] += 1
+                examples = phrase_examples[phrase]
+                if len(examples) < _MAX_EXAMPLES:
+                    examples.append(prompt.prompt)
+                if prompt.category:
+                    phrase_categories[phrase][prompt.category] += 1
+
+            # Extract n-grams (3-5 words): the rolling-hash and sliding
+            # indicator-count loops run in the (optionally JIT-compiled)
+            # kernels, and only candidate windows touch the Python dicts
+            flags = array('b', (indicator_flags[wid] for wid in ids))
             for n in range(3, 6):
-                for i in range(len(words) - n + 1):
-                    ngram = ' '.join(words[i:i+n])
-                    # Filter out common non-attack phrases
-                    if self._is_potential_attack_phrase(ngram):
-                        phrase_counter[ngram] += 1
-                        phrase_examples[ngram].append(prompt.prompt)
-                        if prompt.category:
-                            phrase_categories[ngram].append(prompt.category)
-        
+                hashes = ngram_hash_series(
+                    ids, n, _HASH_BASE, _HASH_MOD, _HASH_SHIFT[n])
+                indicator_counts = window_flag_counts(flags, n)
+                for pos, h in enumerate(hashes):
+                    if indicator_counts[pos] and h not in common_hashes:
+                        ngram_counter[h] += 1
+
+        # Merge n-gram counts of predefined phrases into their string
+        # keys, then take the top 50 of the combined view with a bounded
+        # heap; everything outside it is never materialized
+        hash_counts: Dict[int, int] = {}
+        for h, count in ngram_counter.items():
+            predef = predef_hashes.get(h)
+            if predef is not None:
+                phrase_counter[predef] += count
+            else:
+                hash_counts[h] = count
+        top = heapq.nlargest(
+            50, chain(phrase_counter.items(), hash_counts.items()),
+            key=lambda item: item[1])
+        top_hashes = {key for key, _ in top if isinstance(key, int)}
+
+        # Second pass collects words, examples and categories only for
+        # the surviving hashes
+        ngram_words: Dict[int, Tuple[int, ...]] = {}
+        ngram_examples: Dict[int, List[str]] = defaultdict(list)
+        ngram_categories: Dict[int, Counter] = defaultdict(Counter)
+        if top_hashes:
+            for prompt, ids in zip(prompts, token_ids):
+                for n in range(3, 6):
+                    hashes = ngram_hash_series(
+                        ids, n, _HASH_BASE, _HASH_MOD, _HASH_SHIFT[n])
+                    for pos, h in enumerate(hashes):
+                        if h in top_hashes:
+                            if h not in ngram_words:
+                                ngram_words[h] = tuple(ids[pos:pos + n])
+                            examples = ngram_examples[h]
+                            if len(examples) < _MAX_EXAMPLES:
+                                examples.append(prompt.prompt)
+                            if prompt.category:
+                                ngram_categories[h][prompt.category] += 1
+
         # Create patterns from frequent phrases
-        for phrase, count in phrase_counter.most_common(50):  # Top 50 phrases
+        id_words = self._id_words
+        for key, count in top:
             if count >= self.min_frequency:
+                if isinstance(key, int):
+                    phrase = ' '.join(id_words[wid] for wid in ngram_words[key])
+                    examples = ngram_examples[key][:5]
+                    categories: Optional[Counter] = ngram_categories.get(key)
+                else:
+                    phrase = key
+                    examples = phrase_examples[key][:5]
+                    categories = phrase_categories.get(key)
+
                 # Determine most common category
-                category = Counter(phrase_categories[phrase]).most_common(1)[0][0] \
-                    if phrase_categories[phrase] else 'unknown'
-                
+                category = categories.most_common(1)[0][0] if categories else 'unknown'
+
                 pattern = ExtractedPattern(
                     pattern=f"Phrase: '{phrase}'",
                     regex=re.escape(phrase),
@@ -230,54 +601,58 @@ class PatternExtractor:
                     technique='phrase_attack',
                     frequency=count,
                     confidence=min(count / 10, 1.0),
-                    examples=phrase_examples[phrase][:5]
+                    examples=examples
                 )
                 patterns.append(pattern)
-        
+
         return patterns
     
-    def _extract_structural_patterns(self, prompts: List[DatasetPrompt]) -> List[ExtractedPattern]:
+    def _extract_structural_patterns(self, prompts: List[DatasetPrompt],
+                                     lower_texts: Optional[List[str]] = None
+                                     ) -> List[ExtractedPattern]:
         """Extract structural patterns (brackets, special characters, etc.)."""
         patterns = []
         structural_counter = Counter()
         structural_examples = defaultdict(list)
-        
-        structural_patterns = [
-            (r'\[\[.*?\]\]', 'double_brackets', 'Special bracket notation'),
-            (r'#{3,}.*?#{3,}', 'hash_markers', 'Hash-marked sections'),
-            (r'<system>.*?</system>', 'xml_tags', 'XML-style tags'),
-            (r'```.*?```', 'code_blocks', 'Code block markers'),
-            (r'ADMIN|SYSTEM|DEBUG|EMERGENCY', 'caps_keywords', 'Uppercase keywords'),
-            (r'!!+|###+|\*\*\*+', 'emphasis_markers', 'Emphasis markers'),
-            (r'\\u[0-9a-fA-F]{4}', 'unicode_escape', 'Unicode escapes'),
-            (r'[A-Z]{2,}[\s_][A-Z]{2,}', 'caps_commands', 'Uppercase commands'),
-        ]
-        
-        for prompt in prompts:
-            for regex, pattern_type, description in structural_patterns:
-                if re.search(regex, prompt.prompt, re.IGNORECASE | re.DOTALL):
+        if lower_texts is None:
+            lower_texts = [prompt.prompt.lower() for prompt in prompts]
+
+        for prompt, text_lower in zip(prompts, lower_texts):
+            text = prompt.prompt
+            # Most prompts carry no structural markers at all; one scan
+            # with the combined alternation rejects those before the
+            # per-type searches run
+            if self._struct_re.search(text) is None:
+                continue
+            for regex, pattern_type in self._struct_lower_res:
+                if regex.search(text_lower):
                     structural_counter[pattern_type] += 1
-                    structural_examples[pattern_type].append(prompt.prompt)
-        
+                    examples = structural_examples[pattern_type]
+                    if len(examples) < _MAX_EXAMPLES:
+                        examples.append(text)
+            for regex, pattern_type in self._struct_cased_res:
+                if regex.search(text):
+                    structural_counter[pattern_type] += 1
+                    examples = structural_examples[pattern_type]
+                    if len(examples) < _MAX_EXAMPLES:
+                        examples.append(text)
+
         # Create patterns from structural elements
         for pattern_type, count in structural_counter.items():
             if count >= self.min_frequency:
-                # Find the corresponding pattern info
-                pattern_info = next((p for p in structural_patterns if p[1] == pattern_type), None)
-                if pattern_info:
-                    regex, _, description = pattern_info
-                    
-                    pattern = ExtractedPattern(
-                        pattern=description,
-                        regex=regex,
-                        category='structural',
-                        technique=pattern_type,
-                        frequency=count,
-                        confidence=min(count / 10, 1.0),
-                        examples=structural_examples[pattern_type][:5]
-                    )
-                    patterns.append(pattern)
-        
+                regex, description = _STRUCT_INFO[pattern_type]
+
+                pattern = ExtractedPattern(
+                    pattern=description,
+                    regex=regex,
+                    category='structural',
+                    technique=pattern_type,
+                    frequency=count,
+                    confidence=min(count / 10, 1.0),
+                    examples=structural_examples[pattern_type][:5]
+                )
+                patterns.append(pattern)
+
         return patterns
     
     def _extract_technique_patterns(self, prompts: List[DatasetPrompt]) -> List[ExtractedPattern]:
@@ -327,11 +702,33 @@ class PatternExtractor:
         # Cluster within each category
         for category, category_patterns in category_groups.items():
             processed = set()
-            
+            # Character 3-shingle sets computed once per pattern; a pair
+            # sharing no shingle at all cannot come near the similarity
+            # threshold, so the full comparison is skipped for it
+            category_shingles = [
+                frozenset(
+                    text[k:k + 3] for k in range(len(text) - 2)
+                )
+                for text in (p.pattern.lower() for p in category_patterns)
+            ]
+
+            # Inverted shingle index: candidates for each pattern come
+            # straight from the posting lists, so fully dissimilar pairs
+            # are never even visited. Too-short patterns without shingles
+            # fall back to being candidates for everything.
+            postings: Dict[str, List[int]] = defaultdict(list)
+            no_shingle: List[int] = []
+            for idx, shingle_set in enumerate(category_shingles):
+                if shingle_set:
+                    for shingle in shingle_set:
+                        postings[shingle].append(idx)
+                else:
+                    no_shingle.append(idx)
+
             for i, pattern1 in enumerate(category_patterns):
                 if i in processed:
                     continue
-                
+
                 # Create new cluster
                 cluster_id += 1
                 cluster = PatternCluster(
@@ -342,12 +739,23 @@ class PatternExtractor:
                 )
                 cluster.add_member(pattern1.pattern)
                 processed.add(i)
-                
-                # Find similar patterns
-                for j, pattern2 in enumerate(category_patterns[i+1:], i+1):
-                    if j in processed:
+                shingles1 = category_shingles[i]
+
+                if shingles1:
+                    candidates: Set[int] = set(no_shingle)
+                    for shingle in shingles1:
+                        candidates.update(postings[shingle])
+                    candidate_order = sorted(candidates)
+                else:
+                    candidate_order = range(i + 1, len(category_patterns))
+
+                # Find similar patterns (ascending j keeps the greedy
+                # assignment identical to the full pairwise scan)
+                for j in candidate_order:
+                    if j <= i or j in processed:
                         continue
-                    
+                    pattern2 = category_patterns[j]
+
                     similarity = self._calculate_similarity(pattern1.pattern, pattern2.pattern)
                     if similarity >= self.similarity_threshold:
                         cluster.add_member(pattern2.pattern)
@@ -391,20 +799,15 @@ class PatternExtractor:
         base = max(patterns, key=lambda p: p.frequency)
         
         # Merge information from all patterns
-        all_examples = []
-        all_variations = []
-        all_models = []
         total_frequency = 0
-        max_confidence = 0
-        
+        max_confidence = 0.0
         for pattern in patterns:
-            all_examples.extend(pattern.examples)
-            all_variations.extend(pattern.variations)
-            all_models.extend(pattern.models_affected)
             total_frequency += pattern.frequency
             max_confidence = max(max_confidence, pattern.confidence)
-        
-        # Create merged pattern
+
+        # Deduplicate lazily over the chained member lists: encounter
+        # order is kept (the old set() round-trip was nondeterministic)
+        # and iteration stops once the head is full
         merged = ExtractedPattern(
             pattern=base.pattern,
             regex=base.regex,
@@ -412,12 +815,13 @@ class PatternExtractor:
             technique=base.technique,
             frequency=total_frequency,
             confidence=max_confidence,
-            examples=list(set(all_examples))[:10],
-            variations=list(set(all_variations))[:10],
+            examples=_dedup_head(chain.from_iterable(p.examples for p in patterns)),
+            variations=_dedup_head(chain.from_iterable(p.variations for p in patterns)),
             effectiveness=base.effectiveness,
-            models_affected=list(set(all_models))
+            models_affected=_dedup_head(
+                chain.from_iterable(p.models_affected for p in patterns), limit=None)
         )
-        
+
         return merged
     
     def _calculate_statistics(self, prompts: List[DatasetPrompt], 
@@ -426,87 +830,92 @@ class PatternExtractor:
         self.statistics = {
             'total_prompts': len(prompts),
             'total_patterns': len(patterns),
-            'patterns_by_category': {},
-            'patterns_by_technique': {},
+            # Category/technique distributions as single C-level tallies
+            'patterns_by_category': dict(Counter(p.category for p in patterns)),
+            'patterns_by_technique': dict(Counter(p.technique for p in patterns)),
             'average_frequency': 0,
             'average_confidence': 0,
             'cluster_count': len(self.pattern_clusters),
             'extraction_time': datetime.now().isoformat()
         }
         
-        # Category distribution
-        for pattern in patterns:
-            cat = pattern.category
-            self.statistics['patterns_by_category'][cat] = \
-                self.statistics['patterns_by_category'].get(cat, 0) + 1
-            
-            tech = pattern.technique
-            self.statistics['patterns_by_technique'][tech] = \
-                self.statistics['patterns_by_technique'].get(tech, 0) + 1
-        
-        # Averages
+        # Averages over packed columns rather than repeated attribute walks
         if patterns:
-            self.statistics['average_frequency'] = \
-                sum(p.frequency for p in patterns) / len(patterns)
-            self.statistics['average_confidence'] = \
-                sum(p.confidence for p in patterns) / len(patterns)
+            frequencies = array('q', (p.frequency for p in patterns))
+            confidences = array('d', (p.confidence for p in patterns))
+            self.statistics['average_frequency'] = sum(frequencies) / len(frequencies)
+            self.statistics['average_confidence'] = sum(confidences) / len(confidences)
     
     def _is_potential_attack_phrase(self, phrase: str) -> bool:
         """Check if a phrase is potentially an attack pattern."""
-        # Filter out common non-attack phrases
-        common_phrases = {
-            'i want to', 'can you please', 'thank you for',
-            'i need to', 'would you mind', 'could you help',
-            'is it possible', 'how can i', 'what is the'
-        }
-        
-        if phrase in common_phrases:
-            return False
-        
-        # Check for attack indicators
-        attack_indicators = [
-            'ignore', 'override', 'bypass', 'system', 'prompt',
-            'admin', 'debug', 'mode', 'instruction', 'reveal'
-        ]
-        
-        return any(indicator in phrase for indicator in attack_indicators)
+        return (phrase not in _COMMON_PHRASES
+                and _ATTACK_IND_RE.search(phrase) is not None)
     
     def _find_common_substrings(self, texts: List[str], min_length: int = 10) -> List[str]:
         """Find common substrings in a list of texts."""
         if not texts:
             return []
-        
-        common_substrings = []
-        
+
         # Use first text as reference
         reference = texts[0].lower()
-        
-        # Find substrings that appear in multiple texts
-        for length in range(min_length, min(len(reference), 50)):
+        others = [text.lower() for text in texts[1:]]
+        required = len(texts) * 0.5  # Appears in at least 50% of texts
+        max_length = min(len(reference), 50) - 1
+
+        common_substrings = []
+        # span_end_at[i] tracks the furthest end of a found match starting
+        # at i; a sweep-time prefix max makes the "already inside a longer
+        # match" test O(1) per window
+        span_end_at = [0] * (len(reference) + 1)
+
+        # Walk lengths longest-first with hashed window sets per text, so
+        # each containment check is an O(1) set probe instead of a full
+        # substring scan. A shorter window lying inside an already found
+        # match is a substring of it and would be dropped as redundant
+        # anyway, so it is skipped up front.
+        for length in range(max_length, min_length - 1, -1):
+            window_sets = [
+                {text[i:i + length] for i in range(len(text) - length + 1)}
+                for text in others
+            ]
+            best_end = 0
             for i in range(len(reference) - length + 1):
-                substring = reference[i:i+length]
-                
-                # Check if substring appears in other texts
-                count = sum(1 for text in texts[1:] if substring in text.lower())
-                
-                if count >= len(texts) * 0.5:  # Appears in at least 50% of texts
+                if span_end_at[i] > best_end:
+                    best_end = span_end_at[i]
+                end = i + length
+                if end <= best_end:
+                    continue
+                substring = reference[i:end]
+                count = sum(1 for windows in window_sets if substring in windows)
+                if count >= required:
                     common_substrings.append(substring)
-        
+                    span_end_at[i] = end
+
         # Remove redundant substrings
-        common_substrings = self._remove_redundant_substrings(common_substrings)
-        
-        return common_substrings
+        return self._remove_redundant_substrings(common_substrings)
     
     def _remove_redundant_substrings(self, substrings: List[str]) -> List[str]:
         """Remove substrings that are contained in longer substrings."""
         sorted_subs = sorted(substrings, key=len, reverse=True)
-        result = []
-        
+        result: List[str] = []
+
+        if any('\x00' in sub for sub in sorted_subs):
+            # Pathological input containing the separator; keep the
+            # simple per-selection scan
+            for sub in sorted_subs:
+                if not any(sub in selected for selected in result):
+                    result.append(sub)
+            return result
+
+        # Selected substrings concatenated around a NUL separator, so
+        # each containment check is one C-level scan of a single buffer
+        # instead of a Python-level probe per selected string
+        joined = '\x00'
         for sub in sorted_subs:
-            # Check if this substring is contained in any already selected
-            if not any(sub in selected for selected in result):
+            if sub not in joined:
                 result.append(sub)
-        
+                joined += sub + '\x00'
+
         return result
     
     def _find_variations(self, pattern: str, examples: List[str]) -> List[str]:
@@ -530,36 +939,15 @@ class PatternExtractor:
     
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts."""
-        return difflib.SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+        return _jaro_winkler(text1.lower(), text2.lower())
     
     def _infer_category(self, keyword: str) -> str:
         """Infer category from keyword."""
-        category_keywords = {
-            'prompt_injection': ['ignore', 'override', 'system', 'prompt', 'instruction'],
-            'jailbreak': ['DAN', 'STAN', 'unrestricted', 'mode', 'developer', 'debug'],
-            'data_extraction': ['reveal', 'show', 'display', 'training', 'dataset'],
-            'manipulation': ['admin', 'emergency', 'urgent', 'critical']
-        }
-        
-        for category, keywords in category_keywords.items():
-            if keyword.lower() in [k.lower() for k in keywords]:
-                return category
-        
-        return 'unknown'
-    
+        return _KEYWORD_CATEGORY.get(keyword.lower(), 'unknown')
+
     def _technique_to_category(self, technique: str) -> str:
         """Map technique to category."""
-        technique_mapping = {
-            'instruction_override': 'prompt_injection',
-            'role_play': 'jailbreak',
-            'direct_query': 'data_extraction',
-            'authority_claim': 'manipulation',
-            'base64': 'encoding',
-            'gradual_erosion': 'multi_turn',
-            'context_switching': 'confusion'
-        }
-        
-        return technique_mapping.get(technique, 'unknown')
+        return _TECHNIQUE_CATEGORY.get(technique, 'unknown')
     
     def generate_pattern_library(self) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -592,33 +980,42 @@ class PatternExtractor:
             format: Export format ('json' or 'python')
         """
         if format == 'json':
-            with open(filepath, 'w') as f:
-                json.dump({
-                    'patterns': [p.to_dict() for p in self.extracted_patterns],
-                    'statistics': self.statistics,
-                    'clusters': [
-                        {
-                            'id': c.id,
-                            'representative': c.representative,
-                            'members': c.members,
-                            'category': c.category
-                        } for c in self.pattern_clusters
-                    ]
-                }, f, indent=2)
-        
+            payload = {
+                'patterns': [p.to_dict() for p in self.extracted_patterns],
+                'statistics': self.statistics,
+                'clusters': [
+                    {
+                        'id': c.id,
+                        'representative': c.representative,
+                        'members': c.members,
+                        'category': c.category
+                    } for c in self.pattern_clusters
+                ]
+            }
+            if _orjson is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(_orjson.dumps(payload, option=_orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(payload, f, indent=2)
+
         elif format == 'python':
-            with open(filepath, 'w') as f:
-                f.write("# Auto-generated pattern library from dataset analysis\n\n")
-                f.write("DATASET_PATTERNS = {\n")
-                
-                library = self.generate_pattern_library()
+            library = self.generate_pattern_library()
+
+            def lines():
+                yield "# Auto-generated pattern library from dataset analysis\n\n"
+                yield "DATASET_PATTERNS = {\n"
                 for category, patterns in library.items():
-                    f.write(f"    '{category}': [\n")
+                    yield f"    '{category}': [\n"
                     for pattern in patterns:
-                        f.write(f"        {repr(pattern)},\n")
-                    f.write("    ],\n")
-                
-                f.write("}\n")
+                        yield f"        {repr(pattern)},\n"
+                    yield "    ],\n"
+                yield "}\n"
+
+            with open(filepath, 'w') as f:
+                # One buffered writelines over a generator instead of a
+                # write call per line
+                f.writelines(lines())
     
     def get_summary(self) -> str:
         """Get a summary of the extraction results."""
@@ -4,16 +4,45 @@ Enhanced with context sensitivity metadata and legitimate use case patterns
 """
 
 import re
-from typing import Dict, List, Any
+import sys
+from array import array
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Any, Tuple
 try:
     # Try relative imports first (when used as module)
-    from .models import WhitelistCategory, CONTEXT_EDUCATIONAL, CONTEXT_RESEARCH, CONTEXT_CODE_BLOCK, CONTEXT_DOCUMENTATION, CONTEXT_USER_INPUT
+    from .models import WhitelistCategory, Context, PatternCategory, CONTEXT_EDUCATIONAL, CONTEXT_RESEARCH, CONTEXT_CODE_BLOCK, CONTEXT_DOCUMENTATION, CONTEXT_USER_INPUT
+    from ._aho_corasick import AhoCorasick
 except ImportError:
     # Fall back to absolute imports (when run directly)
-    from models import WhitelistCategory, CONTEXT_EDUCATIONAL, CONTEXT_RESEARCH, CONTEXT_CODE_BLOCK, CONTEXT_DOCUMENTATION, CONTEXT_USER_INPUT
+    from models import WhitelistCategory, Context, PatternCategory, CONTEXT_EDUCATIONAL, CONTEXT_RESEARCH, CONTEXT_CODE_BLOCK, CONTEXT_DOCUMENTATION, CONTEXT_USER_INPUT
+    from _aho_corasick import AhoCorasick
 
-def get_threat_patterns() -> Dict[str, Dict[str, Any]]:
-    """Load comprehensive threat detection patterns with context sensitivity"""
+# Optional acceleration: the third-party `regex` module matches
+# alternation-heavy patterns faster than the stdlib backtracker while
+# exposing the same compile/search API. The package stays zero-dependency;
+# it is picked up only when already installed.
+try:
+    import regex as _re_impl  # type: ignore
+except ImportError:
+    _re_impl = re
+
+
+def _freeze(value):
+    """Recursively convert dicts to read-only proxies and lists to tuples.
+
+    The pattern tables never change after import; freezing them lets the
+    getters hand out one shared structure instead of rebuilding dicts and
+    lists on every call.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _build_threat_patterns() -> Dict[str, Dict[str, Any]]:
     return {
         "prompt_injection": {
             "patterns": [
@@ -126,108 +155,203 @@ def get_threat_patterns() -> Dict[str, Dict[str, Any]]:
         }
     }
 
+_THREAT_PATTERNS = _freeze(_build_threat_patterns())
+
+def get_threat_patterns() -> Dict[str, Dict[str, Any]]:
+    """Load comprehensive threat detection patterns with context sensitivity"""
+    return _THREAT_PATTERNS
+
+# Whitelist pattern sources. The strings keep their inline (?i) prefix for
+# callers that consume them raw; the compiled tables below strip it and carry
+# re.IGNORECASE on the pattern object instead.
+_WHITELIST_SOURCES: Dict[WhitelistCategory, Tuple[str, ...]] = {
+    WhitelistCategory.SECURITY_EDUCATION: (
+        r"(?i)this\s+is\s+an?\s+example\s+of\s+(?:a\s+)?prompt\s+injection",
+        r"(?i)to\s+demonstrate\s+(?:a\s+)?(?:potential\s+)?vulnerability",
+        r"(?i)educational\s+purposes?\s+only",
+        r"(?i)learn(?:ing)?\s+about\s+(?:AI\s+)?security",
+        r"(?i)understand(?:ing)?\s+(?:how\s+)?attacks?\s+work",
+        r"(?i)for\s+(?:teaching|educational|academic)\s+purposes?",
+        r"(?i)example\s+of\s+(?:a\s+)?(?:security\s+)?(?:vulnerability|attack)",
+        r"(?i)let\s+me\s+(?:explain|show|demonstrate)",
+    ),
+
+    WhitelistCategory.ACADEMIC_RESEARCH: (
+        r"(?i)research(?:ing)?\s+(?:AI\s+)?vulnerabilit(?:y|ies)",
+        r"(?i)academic\s+(?:study|paper|research)",
+        r"(?i)thesis\s+on\s+(?:AI\s+)?security",
+        r"(?i)dissertation\s+(?:about|on)\s+",
+        r"(?i)peer[- ]reviewed\s+(?:paper|article|study)",
+        r"(?i)(?:security\s+)?research\s+(?:project|study)",
+        r"(?i)analyzing\s+(?:AI\s+)?(?:security\s+)?(?:vulnerabilities|threats)",
+    ),
+
+    WhitelistCategory.DOCUMENTATION: (
+        r"(?i)(?:security\s+)?documentation",
+        r"(?i)(?:API|system)\s+reference",
+        r"(?i)(?:user|developer|security)\s+guide",
+        r"(?i)(?:threat|risk)\s+model(?:ing)?",
+        r"(?i)security\s+best\s+practices?",
+        r"(?i)(?:technical\s+)?specification",
+        r"(?i)(?:security\s+)?policy\s+document",
+    ),
+
+    WhitelistCategory.META_DISCUSSION: (
+        r"(?i)discuss(?:ing)?\s+(?:about\s+)?prompt\s+injection",
+        r"(?i)talk(?:ing)?\s+about\s+(?:AI\s+)?security",
+        r"(?i)explain(?:ing)?\s+(?:how\s+)?(?:the\s+)?attack",
+        r"(?i)describ(?:e|ing)\s+(?:the\s+)?vulnerability",
+        r"(?i)analyz(?:e|ing)\s+(?:the\s+)?threat",
+        r"(?i)(?:what\s+is|define)\s+(?:a\s+)?prompt\s+injection",
+        r"(?i)(?:security\s+)?awareness\s+(?:training|discussion)",
+    ),
+
+    WhitelistCategory.TESTING_DEMO: (
+        r"(?i)(?:security\s+)?(?:test|testing|demo|demonstration)",
+        r"(?i)penetration\s+test(?:ing)?",
+        r"(?i)(?:ethical\s+)?(?:hacking|testing)",
+        r"(?i)(?:security\s+)?(?:audit|assessment)",
+        r"(?i)(?:red\s+team|blue\s+team)\s+(?:exercise|test)",
+        r"(?i)(?:vulnerability\s+)?(?:scan|scanning)",
+    ),
+
+    WhitelistCategory.CODE_EXAMPLE: (
+        r"(?i)code\s+example",
+        r"(?i)(?:programming|coding)\s+(?:example|demo)",
+        r"(?i)(?:function|method|class)\s+(?:example|demo)",
+        r"(?i)(?:implementation\s+)?example",
+        r"(?i)sample\s+code",
+    ),
+}
+
+_LEGIT_CONTEXT_SOURCES: Tuple[str, ...] = (
+    # Educational indicators
+    r"(?i)(?:for\s+)?(?:educational|academic|teaching|learning)\s+purposes?",
+    r"(?i)(?:this\s+)?(?:example|demonstration|tutorial|lesson)",
+    r"(?i)(?:to\s+)?(?:explain|understand|learn|teach|show)",
+    r"(?i)(?:security\s+)?(?:awareness|education|training)",
+    
+    # Research indicators
+    r"(?i)(?:research|study|analysis|investigation)",
+    r"(?i)(?:academic|scientific|scholarly)\s+(?:paper|study|research)",
+    r"(?i)(?:thesis|dissertation|publication)",
+    r"(?i)(?:peer[- ]reviewed|published)\s+(?:paper|article|study)",
+    
+    # Meta-discussion indicators
+    r"(?i)(?:discussing|talking\s+about|explaining|describing)",
+    r"(?i)(?:what\s+is|define|definition\s+of)",
+    r"(?i)(?:how\s+(?:does|do)|why\s+(?:does|do))",
+    r"(?i)(?:security\s+)?(?:concept|principle|theory)",
+    
+    # Documentation indicators
+    r"(?i)(?:documentation|manual|guide|reference)",
+    r"(?i)(?:policy|procedure|guideline|standard)",
+    r"(?i)(?:specification|requirement|design)",
+    
+    # Testing indicators
+    r"(?i)(?:test|testing|demo|demonstration|proof[- ]of[- ]concept)",
+    r"(?i)(?:penetration|security|vulnerability)\s+test(?:ing)?",
+    r"(?i)(?:ethical\s+)?(?:hacking|testing)",
+)
+
+
+# Literal-word alternation groups like (?:test|testing|demo|demonstration):
+# candidates for trie factoring before compilation
+_PLAIN_ALTERNATION_RE = re.compile(r"\(\?:([A-Za-z]+(?:\|[A-Za-z]+)+)\)")
+
+def _trie_body(words: List[str]) -> str:
+    """Emit a regex fragment matching exactly the given literal words.
+
+    Builds a character trie and serializes it as nested alternations, so
+    shared prefixes are matched once instead of re-tried per branch by
+    the backtracking engine.
+    """
+    heads: Dict[str, List[str]] = {}
+    has_empty = False
+    for word in words:
+        if word:
+            heads.setdefault(word[0], []).append(word[1:])
+        else:
+            has_empty = True
+    branches = [re.escape(head) + _trie_body(tails)
+                for head, tails in heads.items()]
+    if not branches:
+        return ''
+    if len(branches) == 1 and not has_empty:
+        return branches[0]
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if has_empty:
+        if len(branches) > 1:
+            return body + '?'
+        return '(?:' + body + ')?'
+    return body
+
+def _factor_alternations(pattern: str) -> str:
+    """Trie-factor every plain-word alternation group in a raw pattern.
+
+    Only groups whose branches are pure ASCII words are rewritten; the
+    factored form matches exactly the same language, wrapped in a
+    non-capturing group so trailing quantifiers keep their scope.
+    """
+    def _replace(match: "re.Match") -> str:
+        words = list(dict.fromkeys(match.group(1).split('|')))
+        body = _trie_body(words)
+        if not (body.startswith('(?:') and body.endswith(')')):
+            body = '(?:' + body + ')'
+        return body
+    return _PLAIN_ALTERNATION_RE.sub(_replace, pattern)
+
+def _compile_caseless(pattern: str) -> "re.Pattern":
+    """Compile a pattern, folding an inline (?i) prefix into the flag.
+
+    Plain-word alternations are trie-factored first; compilation uses the
+    `regex` engine when available, the stdlib `re` otherwise. Both return
+    pattern objects with the same search/match interface.
+    """
+    if pattern.startswith("(?i)"):
+        pattern = pattern[4:]
+    return _re_impl.compile(_factor_alternations(pattern), _re_impl.IGNORECASE)
+
+# Compiled once at import: scans reuse these pattern objects instead of
+# re-parsing the source strings (or churning re's internal cache) per call
+_WHITELIST_COMPILED: Dict[WhitelistCategory, Tuple["re.Pattern", ...]] = {
+    category: tuple(_compile_caseless(p) for p in patterns)
+    for category, patterns in _WHITELIST_SOURCES.items()
+}
+_LEGIT_CONTEXT_COMPILED: Tuple["re.Pattern", ...] = tuple(
+    _compile_caseless(p) for p in _LEGIT_CONTEXT_SOURCES)
+
 def get_whitelist_patterns() -> Dict[WhitelistCategory, List[str]]:
     """Get whitelist patterns for legitimate use case detection"""
-    return {
-        WhitelistCategory.SECURITY_EDUCATION: [
-            r"(?i)this\s+is\s+an?\s+example\s+of\s+(?:a\s+)?prompt\s+injection",
-            r"(?i)to\s+demonstrate\s+(?:a\s+)?(?:potential\s+)?vulnerability",
-            r"(?i)educational\s+purposes?\s+only",
-            r"(?i)learn(?:ing)?\s+about\s+(?:AI\s+)?security",
-            r"(?i)understand(?:ing)?\s+(?:how\s+)?attacks?\s+work",
-            r"(?i)for\s+(?:teaching|educational|academic)\s+purposes?",
-            r"(?i)example\s+of\s+(?:a\s+)?(?:security\s+)?(?:vulnerability|attack)",
-            r"(?i)let\s+me\s+(?:explain|show|demonstrate)",
-        ],
-        
-        WhitelistCategory.ACADEMIC_RESEARCH: [
-            r"(?i)research(?:ing)?\s+(?:AI\s+)?vulnerabilit(?:y|ies)",
-            r"(?i)academic\s+(?:study|paper|research)",
-            r"(?i)thesis\s+on\s+(?:AI\s+)?security",
-            r"(?i)dissertation\s+(?:about|on)\s+",
-            r"(?i)peer[- ]reviewed\s+(?:paper|article|study)",
-            r"(?i)(?:security\s+)?research\s+(?:project|study)",
-            r"(?i)analyzing\s+(?:AI\s+)?(?:security\s+)?(?:vulnerabilities|threats)",
-        ],
-        
-        WhitelistCategory.DOCUMENTATION: [
-            r"(?i)(?:security\s+)?documentation",
-            r"(?i)(?:API|system)\s+reference",
-            r"(?i)(?:user|developer|security)\s+guide",
-            r"(?i)(?:threat|risk)\s+model(?:ing)?",
-            r"(?i)security\s+best\s+practices?",
-            r"(?i)(?:technical\s+)?specification",
-            r"(?i)(?:security\s+)?policy\s+document",
-        ],
-        
-        WhitelistCategory.META_DISCUSSION: [
-            r"(?i)discuss(?:ing)?\s+(?:about\s+)?prompt\s+injection",
-            r"(?i)talk(?:ing)?\s+about\s+(?:AI\s+)?security",
-            r"(?i)explain(?:ing)?\s+(?:how\s+)?(?:the\s+)?attack",
-            r"(?i)describ(?:e|ing)\s+(?:the\s+)?vulnerability",
-            r"(?i)analyz(?:e|ing)\s+(?:the\s+)?threat",
-            r"(?i)(?:what\s+is|define)\s+(?:a\s+)?prompt\s+injection",
-            r"(?i)(?:security\s+)?awareness\s+(?:training|discussion)",
-        ],
-        
-        WhitelistCategory.TESTING_DEMO: [
-            r"(?i)(?:security\s+)?(?:test|testing|demo|demonstration)",
-            r"(?i)penetration\s+test(?:ing)?",
-            r"(?i)(?:ethical\s+)?(?:hacking|testing)",
-            r"(?i)(?:security\s+)?(?:audit|assessment)",
-            r"(?i)(?:red\s+team|blue\s+team)\s+(?:exercise|test)",
-            r"(?i)(?:vulnerability\s+)?(?:scan|scanning)",
-        ],
-        
-        WhitelistCategory.CODE_EXAMPLE: [
-            r"(?i)code\s+example",
-            r"(?i)(?:programming|coding)\s+(?:example|demo)",
-            r"(?i)(?:function|method|class)\s+(?:example|demo)",
-            r"(?i)(?:implementation\s+)?example",
-            r"(?i)sample\s+code",
-        ]
-    }
+    return {category: list(patterns)
+            for category, patterns in _WHITELIST_SOURCES.items()}
+
+def get_whitelist_patterns_compiled() -> Dict[WhitelistCategory, Tuple["re.Pattern", ...]]:
+    """Get the whitelist patterns as precompiled regex objects"""
+    return _WHITELIST_COMPILED
 
 def get_legitimate_context_patterns() -> List[str]:
     """Get patterns that indicate legitimate educational or research context"""
-    return [
-        # Educational indicators
-        r"(?i)(?:for\s+)?(?:educational|academic|teaching|learning)\s+purposes?",
-        r"(?i)(?:this\s+)?(?:example|demonstration|tutorial|lesson)",
-        r"(?i)(?:to\s+)?(?:explain|understand|learn|teach|show)",
-        r"(?i)(?:security\s+)?(?:awareness|education|training)",
-        
-        # Research indicators
-        r"(?i)(?:research|study|analysis|investigation)",
-        r"(?i)(?:academic|scientific|scholarly)\s+(?:paper|study|research)",
-        r"(?i)(?:thesis|dissertation|publication)",
-        r"(?i)(?:peer[- ]reviewed|published)\s+(?:paper|article|study)",
-        
-        # Meta-discussion indicators
-        r"(?i)(?:discussing|talking\s+about|explaining|describing)",
-        r"(?i)(?:what\s+is|define|definition\s+of)",
-        r"(?i)(?:how\s+(?:does|do)|why\s+(?:does|do))",
-        r"(?i)(?:security\s+)?(?:concept|principle|theory)",
-        
-        # Documentation indicators
-        r"(?i)(?:documentation|manual|guide|reference)",
-        r"(?i)(?:policy|procedure|guideline|standard)",
-        r"(?i)(?:specification|requirement|design)",
-        
-        # Testing indicators
-        r"(?i)(?:test|testing|demo|demonstration|proof[- ]of[- ]concept)",
-        r"(?i)(?:penetration|security|vulnerability)\s+test(?:ing)?",
-        r"(?i)(?:ethical\s+)?(?:hacking|testing)",
-    ]
+    return list(_LEGIT_CONTEXT_SOURCES)
+
+def get_legitimate_context_patterns_compiled() -> Tuple["re.Pattern", ...]:
+    """Get the legitimate context patterns as precompiled regex objects"""
+    return _LEGIT_CONTEXT_COMPILED
 
-# High concern patterns that should have reduced context adjustment
-HIGH_CONCERN_PATTERNS = [
+# High concern patterns that should have reduced context adjustment.
+# The tuple fixes iteration and serialization order; the frozenset gives
+# O(1) membership tests; the combined regex answers "does this text
+# mention any of them?" in a single C-level search.
+HIGH_CONCERN_PATTERNS_ORDERED = (
     "ignore previous instructions",
     "system prompt",
     "admin access",
     "override instructions",
-    "emergency override"
-]
+    "emergency override",
+)
+HIGH_CONCERN_PATTERNS = frozenset(HIGH_CONCERN_PATTERNS_ORDERED)
+HIGH_CONCERN_RE = re.compile(
+    '|'.join(re.escape(p) for p in HIGH_CONCERN_PATTERNS_ORDERED))
 
 # Pattern configuration for smart matching
 SMART_PATTERN_CONFIG = {
@@ -241,31 +365,40 @@ SMART_PATTERN_CONFIG = {
 }
 
 # Import attack chain patterns from dedicated module
+def __getattr__(name: str) -> Any:
+    """Resolve the attack_chains module lazily on first access (PEP 562).
+
+    importing patterns no longer pulls in attack_chains; the module is
+    imported the first time _attack_chains_mod is touched and the result
+    is written back into globals(), so later accesses are plain
+    dictionary lookups with no __getattr__ involvement at all.
+    """
+    if name == '_attack_chains_mod':
+        try:
+            from . import attack_chains as chains_mod
+        except ImportError:
+            import attack_chains as chains_mod
+        globals()['_attack_chains_mod'] = chains_mod
+        return chains_mod
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name))
+
 def get_attack_chain_patterns():
     """Import attack chain patterns from attack_chains module"""
-    try:
-        from .attack_chains import get_attack_chain_patterns as get_chains
-    except ImportError:
-        from attack_chains import get_attack_chain_patterns as get_chains
-    return get_chains()
+    chains_mod = globals().get('_attack_chains_mod')
+    if chains_mod is None:
+        # Global lookups inside the module bypass PEP 562, so trigger
+        # the lazy resolver explicitly on the first call
+        chains_mod = __getattr__('_attack_chains_mod')
+    return chains_mod.get_attack_chain_patterns()
 # Dataset-derived patterns from HackAPrompt analysis
-def get_dataset_derived_patterns() -> Dict[str, Dict[str, Any]]:
-    """
-    Get patterns extracted from the HackAPrompt dataset (600k+ real attack prompts).
-    
-    These patterns are derived from analyzing real-world attack attempts and
-    represent common techniques observed in the wild. They complement the
-    manually curated patterns above with data-driven insights.
-    
-    Note: In production, these patterns would be automatically generated
-    by running pattern_extractor.py on the full HackAPrompt dataset.
-    """
+def _build_dataset_derived_patterns() -> Dict[str, Dict[str, Any]]:
     return {
         "encoding_attacks": {
             "patterns": [
                 # Base64 encoding attempts
-                r"(?i)decode.*?base64",
-                r"(?i)base64.*?decode",
+                r"(?i)decode[^\n]{0,200}?base64",
+                r"(?i)base64[^\n]{0,200}?decode",
                 r"[A-Za-z0-9+/]{20,}={0,2}",  # Base64 pattern
                 
                 # ROT13 and other encodings
@@ -298,9 +431,9 @@ def get_dataset_derived_patterns() -> Dict[str, Dict[str, Any]]:
             "patterns": [
                 # Gradual trust building
                 r"(?i)let'?s\s+(?:discuss|talk\s+about|explore)",
-                r"(?i)interesting.*?(?:can\s+you|could\s+you|would\s+you)",
-                r"(?i)(?:hypothetically|theoretically).*?(?:if|suppose)",
-                r"(?i)for\s+(?:research|academic|educational).*?purposes",
+                r"(?i)interesting[^\n]{0,200}?(?:can\s+you|could\s+you|would\s+you)",
+                r"(?i)(?:hypothetically|theoretically)[^\n]{0,200}?(?:if|suppose)",
+                r"(?i)for\s+(?:research|academic|educational)[^\n]{0,200}?purposes",
                 
                 # Context switching
                 r"(?i)(?:now|but)\s+(?:imagine|pretend|suppose)",
@@ -356,7 +489,7 @@ def get_dataset_derived_patterns() -> Dict[str, Dict[str, Any]]:
                 # Instruction markers
                 r"(?i)###\s*(?:system|admin|override|instructions)",
                 r"(?i)\[\[\s*(?:system|admin|instructions)\s*\]\]",
-                r"(?i)<(?:system|admin|override)>.*?</(?:system|admin|override)>",
+                r"(?i)<(?:system|admin|override)>[^\n]{0,200}?</(?:system|admin|override)>",
                 
                 # Command injection style
                 r"(?i)(?:new|updated|revised)\s+(?:instructions|rules|commands)",
@@ -384,11 +517,11 @@ def get_dataset_derived_patterns() -> Dict[str, Dict[str, Any]]:
         "confusion_techniques": {
             "patterns": [
                 # Logic puzzles and paradoxes
-                r"(?i)if\s+.*?\s+then\s+.*?\s+(?:therefore|thus|so)",
-                r"(?i)(?:prove|show)\s+that\s+.*?\s+(?:equals|is)",
+                r"(?i)if\s+[^\n]{0,200}?\s+then\s+[^\n]{0,200}?\s+(?:therefore|thus|so)",
+                r"(?i)(?:prove|show)\s+that\s+[^\n]{0,200}?\s+(?:equals|is)",
                 
                 # Language switching
-                r"(?i)translate.*?(?:then|and)\s+(?:follow|execute|do)",
+                r"(?i)translate[^\n]{0,200}?(?:then|and)\s+(?:follow|execute|do)",
                 r"(?i)(?:in|using)\s+(?:french|spanish|german|chinese)",
                 
                 # Nested instructions
@@ -396,7 +529,7 @@ def get_dataset_derived_patterns() -> Dict[str, Dict[str, Any]]:
                 r"(?i)continue\s+(?:as|like|from)",
                 
                 # Mathematical/logical confusion
-                r"(?i)(?:calculate|compute|solve).*?(?:therefore|thus)",
+                r"(?i)(?:calculate|compute|solve)[^\n]{0,200}?(?:therefore|thus)",
                 r"(?i)(?:true|false)\s+(?:equals|means)",
             ],
             "severity": 24,
@@ -421,7 +554,7 @@ def get_dataset_derived_patterns() -> Dict[str, Dict[str, Any]]:
                 r"(?i)(?:pretend|imagine)\s+(?:you'?re|you\s+are|to\s+be)",
                 
                 # Character/persona switching
-                r"(?i)(?:enable|activate|switch\s+to)\s+.*?\s+mode",
+                r"(?i)(?:enable|activate|switch\s+to)\s+[^\n]{0,200}?\s+mode",
                 r"(?i)(?:DAN|STAN|DUDE|EVIL)\s+(?:mode|persona|character)",
                 r"(?i)(?:jailbreak|unrestricted|unlimited)\s+(?:mode|version)",
                 
@@ -444,11 +577,172 @@ def get_dataset_derived_patterns() -> Dict[str, Dict[str, Any]]:
         }
     }
 
+@lru_cache(maxsize=1)
+def get_literal_needle_map() -> Dict[str, Tuple[Tuple[str, str, int], ...]]:
+    """Master map of lowercased literal needle to its owning categories.
+
+    The manually curated, Reddit-sourced, and community categories hold
+    plain substrings; dataset-derived categories hold regexes and are
+    excluded. Each needle is interned and stored once - a string that
+    appears in several categories collapses to a single key whose owners
+    tuple lists every (category, original pattern, severity), so one
+    scan can report all owning categories per hit.
+    """
+    needle_map: Dict[str, List[Tuple[str, str, int]]] = {}
+    for source in (get_threat_patterns, get_reddit_jailbreak_patterns,
+                   get_community_patterns):
+        for category, data in source().items():
+            severity = data["severity"]
+            for pattern in data["patterns"]:
+                needle = sys.intern(pattern.lower())
+                owners = needle_map.setdefault(needle, [])
+                owner = (category, pattern, severity)
+                if owner not in owners:
+                    owners.append(owner)
+    return MappingProxyType(
+        {needle: tuple(owners) for needle, owners in needle_map.items()})
+
+@lru_cache(maxsize=1)
+def get_literal_regexes() -> Dict[str, "re.Pattern"]:
+    """One compiled trie-factored regex per literal category.
+
+    Each category's needles are merged into a single alternation (with
+    shared prefixes factored by _trie_body), so scanning a category is
+    one C-level finditer call instead of a Python loop over its needles.
+    Complements the cross-category automaton for callers that want
+    per-category matching.
+    """
+    by_category: Dict[str, List[str]] = {}
+    for needle, owners in get_literal_needle_map().items():
+        for category, _pattern, _severity in owners:
+            by_category.setdefault(category, []).append(needle)
+    compiled = {}
+    for category, needles in by_category.items():
+        body = _trie_body(needles)
+        if not (body.startswith('(?:') and body.endswith(')')):
+            body = '(?:' + body + ')'
+        compiled[category] = _re_impl.compile(body, _re_impl.IGNORECASE)
+    return MappingProxyType(compiled)
+
+@lru_cache(maxsize=1)
+def get_non_ascii_literals() -> frozenset:
+    """Literal needles containing at least one non-ASCII codepoint.
+
+    A handful of needles (the Unicode-bypass probe, homoglyph and
+    zero-width tricks) are non-ASCII; everything else is plain ASCII.
+    Callers with str.isascii() inputs can skip this set entirely.
+    """
+    return frozenset(needle for needle in get_literal_needle_map()
+                     if not needle.isascii())
+
+@lru_cache(maxsize=1)
+def get_pattern_categories() -> Dict[str, PatternCategory]:
+    """Every literal/regex category as a frozen PatternCategory.
+
+    Attribute access (category.severity) instead of dict subscripts, one
+    object per category built once and cached. Attack chain categories
+    are stage-based rather than pattern-based and are not included; the
+    dict getters remain the canonical serializable form.
+    """
+    categories = {}
+    for name, data in iter_all_patterns():
+        if "patterns" not in data:
+            continue
+        weights = data["context_sensitivity"]
+        categories[name] = PatternCategory(
+            name=name,
+            patterns=tuple(data["patterns"]),
+            severity=data["severity"],
+            description=data["description"],
+            context_weights=tuple(weights[context]
+                                  for context in CONTEXT_ORDER),
+            clustering_weight=data["clustering_weight"],
+            position_sensitivity=data["position_sensitivity"],
+            dataset_confidence=data.get("dataset_confidence"),
+            reddit_effectiveness=data.get("reddit_effectiveness"),
+            community_confidence=data.get("community_confidence"),
+        )
+    return MappingProxyType(categories)
+
+@lru_cache(maxsize=1)
+def get_first_char_index() -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """Literal needles bucketed by their first (lowercase) character.
+
+    Maps first character to the (category, pattern) pairs whose needle
+    starts with it. Callers that only want candidates around a known
+    position - highlighting, explain tooling - can narrow ~140 needles
+    to one bucket with a single dict lookup instead of walking the
+    whole table; full-text scanning should keep using the automaton.
+    """
+    buckets: Dict[str, List[Tuple[str, str]]] = {}
+    for needle, owners in get_literal_needle_map().items():
+        bucket = buckets.setdefault(needle[0], [])
+        for category, pattern, _severity in owners:
+            bucket.append((category, pattern))
+    return MappingProxyType({char: tuple(pairs)
+                             for char, pairs in buckets.items()})
+
+@lru_cache(maxsize=2)
+def get_literal_automaton(ascii_only: bool = False) -> AhoCorasick:
+    """Get the shared automaton over all literal threat patterns.
+
+    Built on first use and cached for the process lifetime: scanning N
+    needles against a text becomes a single pass over the text instead
+    of one substring search per needle. Needles are lowercased for
+    matching against normalized text; payloads carry (category,
+    original pattern) so one pass reports every owning category.
+
+    With ascii_only=True the non-ASCII needles are left out; for inputs
+    where text.isascii() holds they can never match, and the smaller
+    trie keeps the root fanout free of the Unicode-bypass branches.
+    """
+    non_ascii = get_non_ascii_literals() if ascii_only else ()
+    automaton = AhoCorasick()
+    for needle, owners in get_literal_needle_map().items():
+        if needle in non_ascii:
+            continue
+        for category, pattern, _severity in owners:
+            automaton.add_word(needle, (category, pattern))
+    automaton.build()
+    return automaton
+
+_DATASET_DERIVED_PATTERNS = _freeze(_build_dataset_derived_patterns())
+
+def get_dataset_derived_patterns() -> Dict[str, Dict[str, Any]]:
+    """
+    Get patterns extracted from the HackAPrompt dataset (600k+ real attack prompts).
+    
+    These patterns are derived from analyzing real-world attack attempts and
+    represent common techniques observed in the wild. They complement the
+    manually curated patterns above with data-driven insights.
+    
+    Note: In production, these patterns would be automatically generated
+    by running pattern_extractor.py on the full HackAPrompt dataset.
+    """
+    return _DATASET_DERIVED_PATTERNS
+
+def iter_all_patterns() -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Iterate (name, category) pairs across every pattern source.
+
+    O(1) to set up - no combined dict is allocated - for callers that
+    only walk the categories; get_all_patterns() remains the cached
+    materialized view for keyed lookups.
+    """
+    return chain(get_threat_patterns().items(),
+                 get_dataset_derived_patterns().items(),
+                 get_reddit_jailbreak_patterns().items(),
+                 get_community_patterns().items(),
+                 (get_attack_chain_patterns() or {}).items())
+
+@lru_cache(maxsize=1)
 def get_all_patterns() -> Dict[str, Dict[str, Any]]:
     """
     Get all patterns including manually curated, dataset-derived,
     Reddit-sourced, and community-contributed patterns.
     
+    The combined view is assembled once per process and cached; repeated
+    calls return the same read-only mapping.
+    
     Returns:
         Combined dictionary of all threat patterns
     """
@@ -471,7 +765,205 @@ def get_all_patterns() -> Dict[str, Dict[str, Any]]:
     if chain_patterns:
         all_patterns.update(chain_patterns)
     
-    return all_patterns
+    return MappingProxyType(all_patterns)
+
+
+@lru_cache(maxsize=1)
+def _dataset_compiled() -> Tuple[Tuple[str, str, "re.Pattern"], ...]:
+    """Every dataset-derived regex compiled once, with its category."""
+    entries = []
+    for category, data in get_dataset_derived_patterns().items():
+        for pattern in data["patterns"]:
+            entries.append((category, pattern, _compile_caseless(pattern)))
+    return tuple(entries)
+
+@lru_cache(maxsize=1)
+def get_dataset_derived_patterns_compiled() -> Dict[str, Tuple[Any, ...]]:
+    """Dataset-derived regexes as compiled pattern objects, per category.
+
+    The "patterns" lists in get_dataset_derived_patterns() stay as plain
+    strings - they are data that callers may serialize or display - so
+    the compiled twins live in this parallel read-only view instead.
+    Compilation happens once per process via _dataset_compiled().
+    """
+    grouped: Dict[str, List[Any]] = {}
+    for category, _pattern, compiled in _dataset_compiled():
+        grouped.setdefault(category, []).append(compiled)
+    return MappingProxyType({category: tuple(compiled_list)
+                             for category, compiled_list in grouped.items()})
+
+@lru_cache(maxsize=1)
+def get_regex_prefilter() -> "re.Pattern":
+    """Combined alternation over every dataset-derived regex.
+
+    A single search of this pattern answers "could any dataset-derived
+    regex match?"; since the alternation's language is the union of the
+    branches, a miss here guarantees every per-pattern scan would miss
+    too, so clean inputs are rejected in one C-level pass.
+    """
+    parts = []
+    for _category, pattern, _compiled in _dataset_compiled():
+        if pattern.startswith('(?i)'):
+            pattern = pattern[4:]
+        parts.append('(?:' + pattern + ')')
+    return _re_impl.compile('|'.join(parts), _re_impl.IGNORECASE)
+
+def scan_dataset_regexes(text: str) -> List[Tuple[str, str]]:
+    """Match all dataset-derived regexes against a text in one call.
+
+    Returns (category, pattern) pairs for every pattern that matches.
+    The prefilter short-circuits the common case of no match at all;
+    only texts that pass are run through the individual patterns.
+    """
+    if get_regex_prefilter().search(text) is None:
+        return []
+    return [(category, pattern)
+            for category, pattern, compiled in _dataset_compiled()
+            if compiled.search(text) is not None]
+
+@lru_cache(maxsize=1)
+def get_categories_by_priority() -> Tuple[str, ...]:
+    """Category names ordered by expected evidence strength, descending.
+
+    Priority is severity weighted by the source's recorded confidence
+    (dataset_confidence, reddit_effectiveness, or community_confidence;
+    manually curated categories count as 1.0). Scanners that support
+    early exit can walk this order and stop once cumulative evidence
+    crosses their threshold, so on benign-majority workloads most
+    categories are never visited.
+    """
+    severity_ranks = {"LOW": 10, "MEDIUM": 20, "HIGH": 30, "CRITICAL": 40}
+
+    def _priority(item):
+        _name, data = item
+        severity = data.get("severity", 0)
+        if isinstance(severity, str):
+            # Attack chain categories grade severity by name
+            severity = severity_ranks.get(severity, 0)
+        confidences = [data[key] for key in ("dataset_confidence",
+                                             "reddit_effectiveness",
+                                             "community_confidence")
+                       if key in data]
+        confidence = max(confidences) if confidences else 1.0
+        return severity * confidence
+    return tuple(name for name, _ in
+                 sorted(iter_all_patterns(), key=_priority, reverse=True))
+
+@lru_cache(maxsize=1)
+def get_literal_needle_map_bytes() -> Dict[bytes, Tuple[Tuple[str, str, int], ...]]:
+    """The literal needle map keyed by UTF-8 encoded needles.
+
+    For callers that scan raw byte buffers (HTTP bodies, log streams):
+    matching bytes directly skips the full decode pass over the input,
+    and ASCII payloads stay at one byte per character.
+    """
+    return MappingProxyType({needle.encode('utf-8'): owners
+                             for needle, owners in get_literal_needle_map().items()})
+
+@lru_cache(maxsize=1)
+def _dataset_compiled_bytes() -> Tuple[Tuple[str, str, Any], ...]:
+    """Dataset-derived regexes compiled as bytes patterns.
+
+    All sources are pure ASCII, so bytes-level IGNORECASE (which only
+    folds ASCII) matches the str-level behavior on the characters the
+    patterns can reach.
+    """
+    entries = []
+    for category, pattern, _compiled in _dataset_compiled():
+        raw = pattern[4:] if pattern.startswith('(?i)') else pattern
+        entries.append((category, pattern,
+                        re.compile(raw.encode('ascii'), re.IGNORECASE)))
+    return tuple(entries)
+
+def scan_dataset_regexes_bytes(data: bytes) -> List[Tuple[str, str]]:
+    """Match all dataset-derived regexes against a raw byte buffer.
+
+    Bytes twin of scan_dataset_regexes for inputs that were never
+    decoded to str; returns the same (category, pattern) pairs.
+    """
+    return [(category, pattern)
+            for category, pattern, compiled in _dataset_compiled_bytes()
+            if compiled.search(data) is not None]
+
+def count_occurrences(text: str, needle: str, caseless: bool = True) -> int:
+    """Count non-overlapping occurrences of a literal needle.
+
+    str.count runs CPython's FASTSEARCH (a Boyer-Moore-Horspool /
+    Crochemore-Perrin hybrid) in C - several times faster than
+    len(re.findall(re.escape(needle), text)) for the same answer. Use
+    this for frequency scoring of the literal patterns; regexes still
+    need their compiled objects.
+    """
+    if caseless:
+        return text.lower().count(needle.lower())
+    return text.count(needle)
+
+def scan_patterns(text: str, compiled_patterns, severities) -> float:
+    """Sum the severities of every compiled pattern that matches text.
+
+    Args:
+        text: Input to scan
+        compiled_patterns: Sequence of compiled regex objects
+        severities: Parallel sequence of numeric severities
+
+    Returns:
+        Total severity over the matching patterns
+
+    The loop keeps everything in locals and only calls the patterns'
+    bound search methods, so per-pattern interpreter overhead is one
+    C call plus one float add.
+    """
+    total = 0.0
+    for compiled, severity in zip(compiled_patterns, severities):
+        if compiled.search(text) is not None:
+            total += severity
+    return total
+
+# Canonical context order for index-based weight lookups; every
+# context_sensitivity table carries exactly these five keys
+# Column order of the packed weight matrix; positions match the
+# models.Context enum so int(Context.X) indexes a row directly
+CONTEXT_ORDER = tuple(context.label for context in Context)
+_CONTEXT_INDEX = {context: index for index, context in enumerate(CONTEXT_ORDER)}
+
+@lru_cache(maxsize=1)
+def get_context_weight_matrix() -> Tuple[Dict[str, int], array, array]:
+    """Context multipliers packed into flat float arrays.
+
+    Returns (category_index, weights, severities): category_index maps a
+    category name to its row, weights is a row-major array('f') with one
+    float per (category, context in CONTEXT_ORDER) cell, and severities
+    holds one float per row. Scoring reads are then indexed loads into
+    4-byte floats instead of string-keyed dict lookups per pattern.
+    """
+    category_index: Dict[str, int] = {}
+    weights = array('f')
+    severities = array('f')
+    for category, data in iter_all_patterns():
+        sensitivity = data.get("context_sensitivity")
+        if sensitivity is None:
+            continue
+        category_index[category] = len(severities)
+        severities.append(data["severity"])
+        for context in CONTEXT_ORDER:
+            weights.append(sensitivity.get(context, 1.0))
+    return MappingProxyType(category_index), weights, severities
+
+def get_context_multiplier(category: str, context: str) -> "float | None":
+    """Context multiplier for a category via the packed weight matrix.
+
+    Returns None when the category has no sensitivity table or the
+    context is not one of the five canonical ones, mirroring the
+    'if context in context_sensitivity' guard callers used before.
+    """
+    context_idx = _CONTEXT_INDEX.get(context)
+    if context_idx is None:
+        return None
+    category_index, weights, _ = get_context_weight_matrix()
+    row = category_index.get(category)
+    if row is None:
+        return None
+    return weights[row * len(CONTEXT_ORDER) + context_idx]
 
 # Pattern statistics from HackAPrompt dataset analysis
 DATASET_STATISTICS = {
@@ -492,16 +984,7 @@ DATASET_STATISTICS = {
     "notes": "Patterns extracted from HackAPrompt dataset using pattern_extractor.py"
 }
 
-def get_reddit_jailbreak_patterns() -> Dict[str, Dict[str, Any]]:
-    """
-    Get patterns sourced from r/ChatGPTJailbreak community.
-    
-    These patterns represent the latest jailbreak techniques discovered
-    and shared by the Reddit community. They are categorized by technique
-    type and include effectiveness ratings based on community testing.
-    
-    Note: In production, these would be dynamically updated from Reddit API.
-    """
+def _build_reddit_jailbreak_patterns() -> Dict[str, Dict[str, Any]]:
     return {
         "reddit_dan_variants": {
             "patterns": [
@@ -794,13 +1277,21 @@ def get_reddit_jailbreak_patterns() -> Dict[str, Dict[str, Any]]:
         }
     }
 
-def get_community_patterns() -> Dict[str, Dict[str, Any]]:
+_REDDIT_JAILBREAK_PATTERNS = _freeze(_build_reddit_jailbreak_patterns())
+
+def get_reddit_jailbreak_patterns() -> Dict[str, Dict[str, Any]]:
     """
-    Get patterns contributed by the security community.
+    Get patterns sourced from r/ChatGPTJailbreak community.
     
-    These patterns are validated and curated from community submissions,
-    including security researchers, ethical hackers, and AI safety experts.
+    These patterns represent the latest jailbreak techniques discovered
+    and shared by the Reddit community. They are categorized by technique
+    type and include effectiveness ratings based on community testing.
+    
+    Note: In production, these would be dynamically updated from Reddit API.
     """
+    return _REDDIT_JAILBREAK_PATTERNS
+
+def _build_community_patterns() -> Dict[str, Dict[str, Any]]:
     return {
         "community_validated": {
             "patterns": [
@@ -829,6 +1320,17 @@ def get_community_patterns() -> Dict[str, Dict[str, Any]]:
         }
     }
 
+_COMMUNITY_PATTERNS = _freeze(_build_community_patterns())
+
+def get_community_patterns() -> Dict[str, Dict[str, Any]]:
+    """
+    Get patterns contributed by the security community.
+    
+    These patterns are validated and curated from community submissions,
+    including security researchers, ethical hackers, and AI safety experts.
+    """
+    return _COMMUNITY_PATTERNS
+
 # Reddit pattern statistics
 REDDIT_PATTERN_STATISTICS = {
     "subreddit": "r/ChatGPTJailbreak",
@@ -8,6 +8,7 @@ multi-step attack patterns, analyze attack evolution, and generate detailed thre
 import json
 import csv
 import re
+import string
 from typing import List, Dict, Any, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -15,14 +16,25 @@ from collections import defaultdict, Counter
 import statistics
 
 from .models import (
-    ConversationHistory, ReplayAnalysis, AttackTimeline, ThreatActor,
-    ConversationTurn, ThreatResult
+    ConversationHistory, ReplayAnalysis, AttackTimeline, TimelineEvent,
+    ThreatActor, ConversationTurn, ThreatResult
 )
 from .scanner import AIThreatScanner
 from .conversation import ConversationAnalyzer
 from .attack_chains import get_attack_chain_patterns
 from .constraint_erosion import ConstraintErosionDetector
 
+# Compiled once at import: the loader matches every line of a
+# transcript, so it should not go through re's per-call cache lookup
+_TEXT_LINE_RE = re.compile(r'\[([^\]]+)\]\s*(User|Assistant|System):\s*(.*)')
+
+# Deletion table for counting special characters: strips ASCII
+# alphanumerics and every Unicode whitespace codepoint (re's \s uses the
+# same isspace predicate; the highest is U+3000, so the scan stops
+# there), leaving exactly the characters [^a-zA-Z0-9\s] would match.
+_NON_SPECIAL_TABLE = str.maketrans('', '', string.ascii_letters + string.digits + ''.join(
+    chr(code) for code in range(0x3001) if chr(code).isspace()))
+
 
 class ConversationReplayAnalyzer:
     """
@@ -115,7 +127,7 @@ class ConversationReplayAnalyzer:
             
             turns = []
             for turn_data in data.get('turns', []):
-                turn = ConversationTurn(
+                turn = ConversationTurn.from_raw(
                     turn_number=turn_data.get('turn_number', 0),
                     role=turn_data.get('role', 'user'),
                     content=turn_data.get('content', ''),
@@ -158,25 +170,22 @@ class ConversationReplayAnalyzer:
             turns = []
             turn_number = 0
             
-            # Pattern to match timestamp and role
-            pattern = r'\[([^\]]+)\]\s*(User|Assistant|System):\s*(.*)'
-            
             for line in lines:
                 line = line.strip()
                 if not line:
                     continue
-                    
-                match = re.match(pattern, line)
+
+                # Match timestamp and role
+                match = _TEXT_LINE_RE.match(line)
                 if match:
                     timestamp_str, role, content = match.groups()
                     turn_number += 1
                     
-                    turn = ConversationTurn(
+                    turn = ConversationTurn.from_raw(
                         turn_number=turn_number,
                         role=role.lower(),
                         content=content,
                         timestamp=timestamp_str,
-                        metadata={}
                     )
                     turns.append(turn)
             
@@ -212,12 +221,11 @@ class ConversationReplayAnalyzer:
             with open(filepath, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
-                    turn = ConversationTurn(
+                    turn = ConversationTurn.from_raw(
                         turn_number=int(row.get('turn_number', 0)),
                         role=row.get('role', 'user').lower(),
                         content=row.get('content', ''),
                         timestamp=row.get('timestamp'),
-                        metadata={}
                     )
                     turns.append(turn)
             
@@ -385,7 +393,10 @@ class ConversationReplayAnalyzer:
         for turn in conversation.turns:
             if turn.role == 'user':
                 # Check for excessive special characters
-                special_char_ratio = len(re.findall(r'[^a-zA-Z0-9\s]', turn.content)) / max(len(turn.content), 1)
+                # translate with the deletion table runs entirely in C and
+                # allocates one string instead of a list of every match
+                special_chars = len(turn.content.translate(_NON_SPECIAL_TABLE))
+                special_char_ratio = special_chars / max(len(turn.content), 1)
                 if special_char_ratio > 0.3:
                     anomaly_indicators.append({
                         'type': 'special_characters',
@@ -582,39 +593,32 @@ class ConversationReplayAnalyzer:
     ) -> None:
         """Build a chronological timeline of attack events."""
         events = []
-        
+
         for attack in analysis.detected_attacks:
-            event = {
-                'turn': attack.get('turn', 0),
-                'timestamp': None,
-                'event_type': attack.get('type', 'unknown'),
-                'description': '',
-                'severity': 'low',
-                'success': False
-            }
-            
             # Get timestamp from turn
+            timestamp = None
             if 'turn' in attack:
                 for turn in conversation.turns:
                     if turn.turn_number == attack['turn']:
-                        event['timestamp'] = turn.timestamp
+                        timestamp = turn.timestamp
                         break
-            
+
             # Determine severity
+            severity = 'low'
             if 'score' in attack:
                 score = attack['score']
                 if score >= 70:
-                    event['severity'] = 'critical'
+                    severity = 'critical'
                 elif score >= 50:
-                    event['severity'] = 'high'
+                    severity = 'high'
                 elif score >= 30:
-                    event['severity'] = 'medium'
-            
+                    severity = 'medium'
+
             # Create description
             if attack.get('type') == 'attack_chain':
-                event['description'] = f"Attack chain detected: {attack.get('chain_type', 'unknown')}"
+                description = f"Attack chain detected: {attack.get('chain_type', 'unknown')}"
             elif attack.get('type') == 'constraint_erosion':
-                event['description'] = f"Constraint erosion detected (score: {attack.get('score', 0):.1f})"
+                description = f"Constraint erosion detected (score: {attack.get('score', 0):.1f})"
             else:
                 threats = attack.get('threats', [])
                 if threats:
@@ -625,15 +629,21 @@ class ConversationReplayAnalyzer:
                             threat_names.append(t.get('category', t.get('type', 'unknown')))
                         else:
                             threat_names.append(str(t))
-                    event['description'] = f"Threats detected: {', '.join(threat_names)}"
+                    description = f"Threats detected: {', '.join(threat_names)}"
                 else:
-                    event['description'] = f"Attack detected: {attack.get('type', 'unknown')}"
-            
-            events.append(event)
-        
+                    description = f"Attack detected: {attack.get('type', 'unknown')}"
+
+            events.append(TimelineEvent(
+                turn=attack.get('turn', 0),
+                timestamp=timestamp,
+                event_type=attack.get('type', 'unknown'),
+                description=description,
+                severity=severity,
+            ))
+
         # Sort events by turn number
-        events.sort(key=lambda x: x['turn'])
-        
+        events.sort(key=lambda x: x.turn)
+
         analysis.attack_timeline.events = events
     
     def _assess_overall_risk(
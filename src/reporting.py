@@ -338,13 +338,13 @@ class ConversationReportGenerator:
             html += "<p>No attack events detected in the conversation.</p>\n"
         else:
             for event in analysis.attack_timeline.events[:20]:  # Limit to 20 events for readability
-                severity_class = event.get('severity', 'low')
+                severity_class = event.severity or 'low'
                 html += f"""
                 <div class="timeline-event {severity_class}">
-                    <strong>Turn {event['turn']}</strong>
-                    {f" - {event['timestamp']}" if event.get('timestamp') else ""}
+                    <strong>Turn {event.turn}</strong>
+                    {f" - {event.timestamp}" if event.timestamp else ""}
                     <br>
-                    <strong>{event['event_type']}</strong>: {event['description']}
+                    <strong>{event.event_type}</strong>: {event.description}
                 </div>
                 """
         
@@ -555,7 +555,7 @@ Breaking AI to build better defenses.
             'correlations': analysis.correlations,
             'threat_actors': [actor.get_profile_summary() for actor in analysis.threat_actors],
             'timeline': {
-                'events': analysis.attack_timeline.events,
+                'events': [event.to_dict() for event in analysis.attack_timeline.events],
                 'summary': analysis.attack_timeline.get_timeline_summary()
             },
             'metadata': analysis.metadata,
@@ -580,10 +580,10 @@ Breaking AI to build better defenses.
         timeline = "Attack Timeline Visualization:\n\n"
         
         # Sort events by turn number
-        events = sorted(analysis.attack_timeline.events, key=lambda x: x['turn'])
-        
+        events = sorted(analysis.attack_timeline.events, key=lambda x: x.turn)
+
         # Create timeline
-        max_turn = max(e['turn'] for e in events)
+        max_turn = max(e.turn for e in events)
         
         # Create severity markers
         severity_markers = {
@@ -607,9 +607,9 @@ Breaking AI to build better defenses.
         timeline += "Events:"
         event_line = "       "
         for turn in range(min(max_turn + 1, 50)):
-            event_at_turn = next((e for e in events if e['turn'] == turn), None)
+            event_at_turn = next((e for e in events if e.turn == turn), None)
             if event_at_turn:
-                marker = severity_markers.get(event_at_turn.get('severity', 'low'), '•')
+                marker = severity_markers.get(event_at_turn.severity or 'low', '•')
                 event_line += marker
             else:
                 event_line += "-"
@@ -13,11 +13,13 @@ try:
         ThreatResult, CONTEXT_USER_INPUT, CONTEXT_LLM_RESPONSE, CONTEXT_UNKNOWN,
         PatternMatch, ContextMetadata, IntentAnalysis, LegitimacyAnalysis, ThreatScore,
         IntentType, WhitelistCategory, ScoringFactors, DEFAULT_WEIGHTS,
-        CONTEXT_EDUCATIONAL, CONTEXT_RESEARCH, CONTEXT_CODE_BLOCK, CONTEXT_DOCUMENTATION
+        CONTEXT_EDUCATIONAL, CONTEXT_RESEARCH, CONTEXT_CODE_BLOCK, CONTEXT_DOCUMENTATION,
+        score_to_level, compute_weighted_score
     )
     from .patterns import (
-        get_threat_patterns, get_whitelist_patterns, get_legitimate_context_patterns,
-        HIGH_CONCERN_PATTERNS, SMART_PATTERN_CONFIG
+        get_threat_patterns, get_whitelist_patterns_compiled,
+        get_legitimate_context_patterns_compiled, get_literal_automaton,
+        get_context_multiplier, HIGH_CONCERN_RE, SMART_PATTERN_CONFIG
     )
     from .context_analyzer import ContextAnalyzer, ContextType
     from .reporting import ReportGenerator
@@ -27,11 +29,13 @@ except ImportError:
         ThreatResult, CONTEXT_USER_INPUT, CONTEXT_LLM_RESPONSE, CONTEXT_UNKNOWN,
         PatternMatch, ContextMetadata, IntentAnalysis, LegitimacyAnalysis, ThreatScore,
         IntentType, WhitelistCategory, ScoringFactors, DEFAULT_WEIGHTS,
-        CONTEXT_EDUCATIONAL, CONTEXT_RESEARCH, CONTEXT_CODE_BLOCK, CONTEXT_DOCUMENTATION
+        CONTEXT_EDUCATIONAL, CONTEXT_RESEARCH, CONTEXT_CODE_BLOCK, CONTEXT_DOCUMENTATION,
+        score_to_level, compute_weighted_score
     )
     from patterns import (
-        get_threat_patterns, get_whitelist_patterns, get_legitimate_context_patterns,
-        HIGH_CONCERN_PATTERNS, SMART_PATTERN_CONFIG
+        get_threat_patterns, get_whitelist_patterns_compiled,
+        get_legitimate_context_patterns_compiled, get_literal_automaton,
+        get_context_multiplier, HIGH_CONCERN_RE, SMART_PATTERN_CONFIG
     )
     from context_analyzer import ContextAnalyzer, ContextType
     from reporting import ReportGenerator
@@ -50,8 +54,8 @@ class AIThreatScanner:
         # Smart matching components (only initialized if enabled)
         if self.smart_matching:
             self.context_analyzer = ContextAnalyzer()
-            self.whitelist_patterns = get_whitelist_patterns()
-            self.legitimate_patterns = get_legitimate_context_patterns()
+            self.whitelist_patterns = get_whitelist_patterns_compiled()
+            self.legitimate_patterns = get_legitimate_context_patterns_compiled()
             self.scoring_weights = DEFAULT_WEIGHTS.copy()
         
         # Conversation tracking components
@@ -71,6 +75,24 @@ class AIThreatScanner:
             # Fall back to v0.1.1 behavior for backward compatibility
             return self._legacy_scan(prompt, context)
     
+    def _find_literal_matches(self, normalized_text: str) -> Dict[Any, int]:
+        """First occurrence per (threat_type, pattern) via one automaton pass.
+
+        Replaces the per-needle substring loop: every literal pattern is
+        matched in a single scan of the text, and the returned positions
+        are identical to what str.find would report per pattern.
+        """
+        found: Dict[Any, int] = {}
+        # Pure-ASCII inputs (the common case) use the smaller automaton
+        # without the non-ASCII bypass needles, which can never match
+        automaton = get_literal_automaton(normalized_text.isascii())
+        for end, payload in automaton.iter(normalized_text):
+            if payload not in found:
+                # payload is (threat_type, pattern); end indexes the last
+                # matched character
+                found[payload] = end - len(payload[1]) + 1
+        return found
+
     def _legacy_scan(self, prompt: str, context: str) -> Dict[str, Any]:
         """Legacy scanning method (v0.1.1 behavior)"""
         threats_found = []
@@ -79,11 +101,13 @@ class AIThreatScanner:
         # Normalize prompt for better detection
         normalized_prompt = prompt.lower().strip()
         
-        # Check each threat category
+        # Check each threat category: one automaton pass over the text,
+        # then emit in category/pattern order as before
+        literal_matches = self._find_literal_matches(normalized_prompt)
         for threat_type, threat_data in self.patterns.items():
             for pattern in threat_data["patterns"]:
-                if pattern.lower() in normalized_prompt:
-                    position = normalized_prompt.find(pattern.lower())
+                position = literal_matches.get((threat_type, pattern))
+                if position is not None:
                     
                     # Apply context-aware severity adjustment
                     base_severity = threat_data["severity"]
@@ -156,51 +180,50 @@ class AIThreatScanner:
         matches = []
         normalized_text = text.lower().strip()
         
+        literal_matches = self._find_literal_matches(normalized_text)
         for threat_type, threat_data in self.patterns.items():
             for pattern in threat_data["patterns"]:
-                if pattern.lower() in normalized_text:
-                    position = normalized_text.find(pattern.lower())
-                    
-                    # Create pattern match with enhanced metadata
-                    match = PatternMatch(
-                        pattern=pattern,
-                        pattern_type=threat_type,
-                        position=position,
-                        confidence=1.0,  # Base confidence
-                        base_severity=threat_data["severity"],
-                        adjusted_severity=threat_data["severity"]
-                    )
-                    
-                    # Extract context window around match
-                    window_size = SMART_PATTERN_CONFIG["context_window_size"] // 2
-                    start = max(0, position - window_size)
-                    end = min(len(text), position + len(pattern) + window_size)
-                    match.context_window = text[start:end]
-                    
-                    # Check for quotes and negation
-                    match.is_quoted = self.context_analyzer.is_quoted_context(text, position)
-                    match.is_negated = self.context_analyzer.is_negated_context(text, position)
-                    
-                    # Apply context-specific adjustments
-                    match = self._apply_context_adjustments(match, context_metadata, threat_data)
-                    
-                    # Calculate semantic coherence
-                    match.semantic_coherence = self._calculate_semantic_coherence(match, context_metadata)
-                    
-                    matches.append(match)
-        
+                position = literal_matches.get((threat_type, pattern))
+                if position is None:
+                    continue
+                # Create pattern match with enhanced metadata
+                match = PatternMatch(
+                    pattern=pattern,
+                    pattern_type=threat_type,
+                    position=position,
+                    confidence=1.0,  # Base confidence
+                    base_severity=threat_data["severity"],
+                    adjusted_severity=threat_data["severity"]
+                )
+
+                # Extract context window around match
+                window_size = SMART_PATTERN_CONFIG["context_window_size"] // 2
+                start = max(0, position - window_size)
+                end = min(len(text), position + len(pattern) + window_size)
+                match.context_window = text[start:end]
+
+                # Check for quotes and negation
+                match.is_quoted = self.context_analyzer.is_quoted_context(text, position)
+                match.is_negated = self.context_analyzer.is_negated_context(text, position)
+
+                # Apply context-specific adjustments
+                match = self._apply_context_adjustments(match, context_metadata, threat_data)
+
+                # Calculate semantic coherence
+                match.semantic_coherence = self._calculate_semantic_coherence(match, context_metadata)
+
+                matches.append(match)
+
         return matches
     
     def _apply_context_adjustments(self, match: PatternMatch, context_metadata: ContextMetadata, threat_data: Dict) -> PatternMatch:
         """Apply context-specific adjustments to pattern match"""
         
-        # Get context sensitivity settings for this threat type
-        context_sensitivity = threat_data.get("context_sensitivity", {})
+        # Context multiplier comes from the packed weight matrix: an
+        # indexed float load instead of per-match dict lookups
         primary_context = self._to_context_str(context_metadata.primary_context)
-        
-        # Apply context-based confidence adjustment
-        if primary_context in context_sensitivity:
-            context_multiplier = context_sensitivity[primary_context]
+        context_multiplier = get_context_multiplier(match.pattern_type, primary_context)
+        if context_multiplier is not None:
             match.confidence *= context_multiplier
             match.adjusted_severity = int(match.base_severity * context_multiplier)
         
@@ -254,17 +277,17 @@ class AIThreatScanner:
         # Check whitelist patterns
         for category, patterns in self.whitelist_patterns.items():
             for pattern_regex in patterns:
-                if re.search(pattern_regex, text, re.IGNORECASE):
+                if pattern_regex.search(text):
                     analysis.is_legitimate = True
                     analysis.category = category
-                    analysis.evidence.append(f"Matched whitelist pattern: {pattern_regex}")
+                    analysis.evidence.append(f"Matched whitelist pattern: {pattern_regex.pattern}")
                     analysis.legitimacy_score += 0.3
         
         # Check legitimate context patterns
         for pattern_regex in self.legitimate_patterns:
-            if re.search(pattern_regex, text, re.IGNORECASE):
+            if pattern_regex.search(text):
                 analysis.legitimacy_score += 0.2
-                analysis.evidence.append(f"Legitimate context indicator: {pattern_regex}")
+                analysis.evidence.append(f"Legitimate context indicator: {pattern_regex.pattern}")
         
         # Context-based legitimacy scoring
         primary_ctx = self._to_context_str(context_metadata.primary_context)
@@ -394,10 +417,14 @@ class AIThreatScanner:
             )
          
         # Calculate weighted final score
-        final_score = 0.0
-        for factor, score in score_components.items():
-            weight = self.scoring_weights.get(factor, 0.0)
-            final_score += score * weight
+        if self.scoring_weights == DEFAULT_WEIGHTS:
+            # Single pass over the frozen weight vector
+            final_score = compute_weighted_score(score_components)
+        else:
+            final_score = 0.0
+            for factor, score in score_components.items():
+                weight = self.scoring_weights.get(factor, 0.0)
+                final_score += score * weight
         
         # Normalize score
         normalized_score = max(0, min(100, final_score))
@@ -520,13 +547,13 @@ class AIThreatScanner:
             "legitimacy_analysis": {
                 "is_legitimate": legitimacy_analysis.is_legitimate,
                 "legitimacy_score": legitimacy_analysis.legitimacy_score,
-                "category": legitimacy_analysis.category.value if legitimacy_analysis.category else None,
+                "category": legitimacy_analysis.category.label if legitimacy_analysis.category is not None else None,
                 "evidence": legitimacy_analysis.evidence
             },
             
             # Intent analysis
             "intent_analysis": {
-                "intent_type": intent_analysis.intent_type.value,
+                "intent_type": intent_analysis.intent_type.label,
                 "confidence": intent_analysis.confidence,
                 "threat_reduction": intent_analysis.threat_reduction,
                 "supporting_evidence": intent_analysis.supporting_evidence
@@ -563,7 +590,7 @@ class AIThreatScanner:
         if context == CONTEXT_LLM_RESPONSE:
             reduction_factor = 0.4  # 60% reduction
             
-            if any(concern_pattern in pattern.lower() for concern_pattern in HIGH_CONCERN_PATTERNS):
+            if HIGH_CONCERN_RE.search(pattern.lower()) is not None:
                 reduction_factor = 0.7  # Only 30% reduction for high-concern patterns
             
             adjusted_severity = int(base_severity * reduction_factor)
@@ -577,16 +604,7 @@ class AIThreatScanner:
     
     def _get_risk_level(self, score: int) -> str:
         """Convert numeric score to risk level"""
-        if score == 0:
-            return "SAFE"
-        elif score < 20:
-            return "LOW"
-        elif score < 50:
-            return "MEDIUM"
-        elif score < 80:
-            return "HIGH"
-        else:
-            return "CRITICAL"
+        return score_to_level(score)
     
     def scan_batch(self, prompts: List[str], context: str = CONTEXT_UNKNOWN) -> List[Dict]:
         """Scan multiple prompts with context awareness